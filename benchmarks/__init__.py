@@ -0,0 +1 @@
+"""Benchmarks for the blog pipeline. Run with ``python -m benchmarks.<name>``."""
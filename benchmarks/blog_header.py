@@ -0,0 +1,48 @@
+"""Compare full frontmatter parsing with the header-only fast path.
+
+Usage: python -m benchmarks.blog_header [POSTS] [WORDS_PER_POST]
+"""
+
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from benchmarks.corpus import write_corpus
+from retest.utils.blog import YAML_LOADER, parse_blog_posts
+
+
+def measure(file_paths, with_content: bool):
+    """Parse the corpus and return (seconds, bytes retained by the results)."""
+    start = time.perf_counter()
+    parse_blog_posts(file_paths, workers=1, with_content=with_content)
+    elapsed = time.perf_counter() - start
+
+    # Measure memory in a second pass, tracemalloc slows parsing down
+    tracemalloc.start()
+    posts = parse_blog_posts(file_paths, workers=1, with_content=with_content)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del posts
+    return elapsed, retained
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    words = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        blog_dir = write_corpus(Path(tmp), count, words)
+        file_paths = sorted(blog_dir.glob("*.md"))
+
+        full_time, full_memory = measure(file_paths, with_content=True)
+        header_time, header_memory = measure(file_paths, with_content=False)
+
+    print(f"posts:       {count} x ~{words} words, YAML loader {YAML_LOADER.__name__}")
+    print(f"full parse:  {full_time:7.3f} s  {full_memory / 1e6:8.1f} MB retained")
+    print(f"header only: {header_time:7.3f} s  {header_memory / 1e6:8.1f} MB retained")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Measure cold-start parsing of the markdown corpus with 1 to N workers.
+
+Usage: python -m benchmarks.blog_parse [POSTS] [MAX_WORKERS] [CHUNKSIZE]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.corpus import write_corpus
+from retest.utils.blog import parse_blog_posts
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    chunksize = int(sys.argv[3]) if len(sys.argv) > 3 else 64
+
+    with tempfile.TemporaryDirectory() as tmp:
+        blog_dir = write_corpus(Path(tmp), count, words_per_post=600)
+        file_paths = sorted(blog_dir.glob("*.md"))
+
+        start = time.perf_counter()
+        expected = parse_blog_posts(file_paths, workers=1)
+        serial = time.perf_counter() - start
+        print(f"{count} posts, {os.cpu_count()} CPUs, chunksize {chunksize}")
+        print(f"serial              {serial:8.3f} s")
+
+        for mode in ("thread", "process"):
+            workers = 1
+            while workers <= max_workers:
+                start = time.perf_counter()
+                results = parse_blog_posts(
+                    file_paths, workers=workers, mode=mode, chunksize=chunksize
+                )
+                elapsed = time.perf_counter() - start
+                assert results == expected, f"{mode} x{workers} differs from serial"
+                print(f"{mode:<7} x{workers:<3}        {elapsed:8.3f} s  ({serial / elapsed:4.2f}x)")
+                workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""Compare the serialized state size of full blog posts and post summaries.
+
+Usage: python -m benchmarks.blog_payload [POSTS] [WORDS_PER_POST]
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmarks.corpus import write_corpus
+from retest.utils.blog import parse_blog_post, summarize_blog_post
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    words = int(sys.argv[2]) if len(sys.argv) > 2 else 800
+
+    with tempfile.TemporaryDirectory() as tmp:
+        blog_dir = write_corpus(Path(tmp), count, words)
+        posts = [parse_blog_post(path) for path in sorted(blog_dir.glob("*.md"))]
+
+    summaries = [summarize_blog_post(post) for post in posts]
+    full_size = len(json.dumps(posts, default=str).encode())
+    summary_size = len(json.dumps(summaries, default=str).encode())
+
+    print(f"posts:              {count} x ~{words} words")
+    print(f"full posts payload: {full_size:>12,} bytes")
+    print(f"summaries payload:  {summary_size:>12,} bytes")
+    print(f"reduction:          {100 * (1 - summary_size / full_size):11.1f} %")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Compare the memory held by post dicts and slotted post records.
+
+Usage: python -m benchmarks.blog_records [POSTS] [WORDS_PER_POST]
+"""
+
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+from benchmarks.corpus import write_corpus
+from retest.utils.blog import parse_blog_posts, summarize_blog_post
+from retest.utils.blog_record import BlogPostRecord, BlogPostSummary
+
+
+def measure(build, headers):
+    """Build the posts and summaries from parsed headers and return the bytes they retain."""
+    tracemalloc.start()
+    posts = build(headers)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del posts
+    return retained
+
+
+def build_dicts(headers):
+    """Copy the headers the way the index used to hold them: a dict per post and summary."""
+    posts = [
+        {
+            **header,
+            "tags": list(header["tags"]),
+            "toc": [dict(entry) for entry in header["toc"]],
+        }
+        for header in headers
+    ]
+    return posts, [summarize_blog_post(post) for post in posts]
+
+
+def build_records(headers):
+    """Build the records the index holds now."""
+    posts = [BlogPostRecord.from_mapping(header) for header in headers]
+    return posts, [BlogPostSummary.from_mapping(post) for post in posts]
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    words = int(sys.argv[2]) if len(sys.argv) > 2 else 400
+
+    with tempfile.TemporaryDirectory() as tmp:
+        blog_dir = write_corpus(Path(tmp), count, words)
+        headers = parse_blog_posts(sorted(blog_dir.glob("*.md")), workers=1, with_content=False)
+
+    dict_memory = measure(build_dicts, headers)
+    record_memory = measure(build_records, headers)
+
+    print(f"posts:     {count} x ~{words} words (headers, summaries and tables of contents)")
+    print(f"dicts:     {dict_memory / 1e6:8.2f} MB  {dict_memory / count:7.0f} B/post")
+    print(f"records:   {record_memory / 1e6:8.2f} MB  {record_memory / count:7.0f} B/post")
+    print(f"reduction: {100 * (1 - record_memory / dict_memory):8.1f} %")
+
+
+if __name__ == "__main__":
+    main()
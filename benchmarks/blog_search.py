@@ -0,0 +1,65 @@
+"""Measure BM25 query latency of the blog search index.
+
+Usage: python -m benchmarks.blog_search [POSTS] [WORDS_PER_POST] [VOCABULARY]
+"""
+
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+
+from benchmarks.corpus import make_vocabulary, write_corpus
+from retest.utils import blog
+from retest.utils.blog_search import BlogSearchIndex
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    words = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    vocabulary_size = int(sys.argv[3]) if len(sys.argv) > 3 else 20000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        blog_dir = write_corpus(Path(tmp), count, words, vocabulary_size=vocabulary_size)
+        with mock.patch.object(blog, "get_blog_posts_directory", return_value=blog_dir):
+            start = time.perf_counter()
+            blog.get_blog_index(force_check=True)
+            index_time = time.perf_counter() - start
+
+            search_index = BlogSearchIndex()
+            start = time.perf_counter()
+            search_index.sync()
+            search_build_time = time.perf_counter() - start
+
+            # Queries of 1-3 words drawn from the whole vocabulary (rare and common)
+            rng = random.Random(1)
+            vocabulary = make_vocabulary(vocabulary_size, random.Random(0))
+            queries = [
+                " ".join(rng.sample(vocabulary[:2000], rng.randint(1, 3)))
+                for _ in range(500)
+            ]
+
+            timings = []
+            for query in queries:
+                start = time.perf_counter()
+                search_index.search(query, snippets=False)
+                timings.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            for query in queries[:50]:
+                search_index.search(query)
+            snippet_time = (time.perf_counter() - start) / 50
+
+    timings.sort()
+    print(f"posts:             {count} x ~{words} words, vocabulary {vocabulary_size}")
+    print(f"blog index build:  {index_time:8.3f} s")
+    print(f"search index build:{search_build_time:8.3f} s")
+    print(f"query median:      {statistics.median(timings) * 1000:8.3f} ms")
+    print(f"query p95:         {timings[int(len(timings) * 0.95)] * 1000:8.3f} ms")
+    print(f"query + snippets:  {snippet_time * 1000:8.3f} ms (mean, cold body cache)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Synthetic markdown corpus used by the blog benchmarks."""
+
+import random
+from pathlib import Path
+
+WORDS = (
+    "python reflex state index cache async markdown render blog search "
+    "server client browser websocket payload deploy docker linux query "
+    "component layout sidebar theme token parser memory latency"
+).split()
+
+TAGS = ["python", "reflex", "web-development", "devops", "tutorial", "rust", "linux"]
+
+
+def make_vocabulary(size: int, rng: random.Random) -> list:
+    """Extend WORDS with pronounceable pseudo-words up to ``size`` entries."""
+    syllables = ["ka", "lo", "mi", "ne", "ru", "sa", "ti", "vo", "ze", "por", "dan", "gel"]
+    vocabulary = list(WORDS)
+    seen = set(vocabulary)
+    while len(vocabulary) < size:
+        word = "".join(rng.choice(syllables) for _ in range(rng.randint(2, 4)))
+        if word not in seen:
+            seen.add(word)
+            vocabulary.append(word)
+    return vocabulary
+
+
+def write_corpus(
+    directory: Path,
+    count: int,
+    words_per_post: int = 800,
+    seed: int = 0,
+    vocabulary_size: int = 0,
+) -> Path:
+    """Write ``count`` markdown posts with YAML frontmatter into ``directory``.
+    
+    Args:
+        directory: Target directory (created if missing)
+        count: Number of posts to write
+        words_per_post: Approximate body length in words
+        seed: Random seed, so runs are reproducible
+        vocabulary_size: Draw words from a Zipf-distributed vocabulary of this
+            size instead of the small fixed WORDS list
+        
+    Returns:
+        The directory the posts were written to
+    """
+    rng = random.Random(seed)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    vocabulary = WORDS
+    cum_weights = None
+    if vocabulary_size:
+        vocabulary = make_vocabulary(vocabulary_size, rng)
+        cum_weights = []
+        total = 0.0
+        for rank in range(1, len(vocabulary) + 1):
+            total += 1.0 / rank
+            cum_weights.append(total)
+
+    for i in range(count):
+        paragraphs = []
+        remaining = words_per_post
+        section = 1
+        while remaining > 0:
+            length = min(remaining, rng.randint(40, 120))
+            paragraphs.append(f"## Section {section}")
+            paragraphs.append(
+                " ".join(rng.choices(vocabulary, cum_weights=cum_weights, k=length))
+            )
+            remaining -= length
+            section += 1
+
+        tags = rng.sample(TAGS, rng.randint(1, 3))
+        body = "\n\n".join(paragraphs)
+        (directory / f"post-{i:05d}.md").write_text(
+            "---\n"
+            f'title: "Synthetic post {i}"\n'
+            f'date: "{2015 + i % 10}-{1 + i % 12:02d}-{1 + i % 28:02d}"\n'
+            f'excerpt: "Excerpt for synthetic post number {i}"\n'
+            f"tags: {tags}\n"
+            f"featured: {'true' if i % 10 == 0 else 'false'}\n"
+            "---\n\n"
+            f"# Synthetic post {i}\n\n{body}\n",
+            encoding="utf-8",
+        )
+
+    return directory
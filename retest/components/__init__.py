@@ -5,6 +5,7 @@ from .sidebar import sidebar, mobile_sidebar
 from .layout import layout, page_layout, footer
 from .page_nav import on_this_page, page_section, tip_box
 from .code import code_block, inline_code, code_snippet
+from .image import responsive_image
 
 __all__ = [
     "header",
@@ -21,4 +22,5 @@ __all__ = [
     "code_block",
     "inline_code",
     "code_snippet",
+    "responsive_image",
 ]
@@ -1,6 +1,17 @@
 """Code block component with syntax highlighting."""
 
+from typing import Tuple
 import reflex as rx
+from ..utils.highlight import highlight_block
+
+
+def _strip_code_fence(code: str, language: str) -> Tuple[str, str]:
+    """Unwrap code passed as a fenced markdown block (```lang ... ```)."""
+    stripped = code.strip()
+    if not stripped.startswith("```") or not stripped.endswith("```"):
+        return code, language
+    first_line, _, body = stripped[:-3].partition("\n")
+    return body.rstrip() + "\n", first_line[3:].strip() or language
 
 
 def code_block(
@@ -10,23 +21,28 @@ def code_block(
     filename: str = "",
     github_url: str = "",
 ) -> rx.Component:
-    """Code block component with custom styling and header."""
-    # For now, use a styled text block with monospace font
-    # TODO: Add proper syntax highlighting when Reflex API is more flexible
+    """Code block component with custom styling and header.
+
+    The code is highlighted with Pygments while the app compiles, so the
+    page ships plain HTML and the browser parses no markdown.
+    """
+    code, language = _strip_code_fence(code, language)
     code_content = rx.box(
-        rx.markdown(
-            code,
+        rx.html(
+            highlight_block(code, language, line_numbers=show_line_numbers),
             style={
-                "font_family": "monospace",
-                "font_size": "0.9rem",
-                "line_height": "1.5",
-                "padding": "0.5rem",
-                "margin": "0",
-                "background_color": "transparent",
-                "border": "none",
-                "overflow_x": "auto",
-                "white_space": "pre",
-                "color": rx.color("gray", 12),
+                "& pre": {
+                    "font_family": "monospace",
+                    "font_size": "0.9rem",
+                    "line_height": "1.5",
+                    "padding": "0.5rem",
+                    "margin": "0",
+                    "background_color": "transparent",
+                    "border": "none",
+                    "overflow_x": "auto",
+                    "white_space": "pre",
+                    "color": rx.color("gray", 12),
+                },
             },
         ),
         style={
@@ -127,6 +143,7 @@ def code_snippet(
     code: str,
     language: str = "python",
     description: str = "",
+    show_line_numbers: bool = False,
 ) -> rx.Component:
     """Code snippet with title and description."""
     return rx.vstack(
@@ -141,7 +158,7 @@ def code_snippet(
             ),
             rx.fragment(),
         ),
-        code_block(code, language),
+        code_block(code, language, show_line_numbers=show_line_numbers),
         spacing="3",
         align="start",
         width="100%",
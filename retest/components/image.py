@@ -0,0 +1,44 @@
+"""Responsive image component."""
+
+import reflex as rx
+from ..utils.images import get_responsive_image
+
+
+def responsive_image(src: str, alt="", sizes: str = "100vw", **props) -> rx.Component:
+    """Responsive image, resolved from the image manifest when the page compiles.
+
+    Args:
+        src: Image URL relative to the site root
+        alt: Alternative text
+        sizes: The ``sizes`` attribute for choosing a variant
+        props: Props (and style) of the <img> element; images load lazily
+            unless ``loading="eager"`` is passed
+
+    Returns:
+        A <picture> with one source per variant format, or a plain <img>
+    """
+    props = {"loading": "lazy", "decoding": "async", **props}
+    entry = get_responsive_image(src)
+    if entry is None:
+        return rx.el.img(src=src, alt=alt, **props)
+
+    # The blur placeholder shows until the image has loaded, and the aspect
+    # ratio reserves its space (Reflex turns width/height props into CSS)
+    style = {
+        "background_image": f"url({entry['placeholder']})",
+        "background_size": "cover",
+        "aspect_ratio": f"{entry['width']} / {entry['height']}",
+        **props.pop("style", {}),
+    }
+    return rx.el.picture(
+        *[
+            rx.el.source(type=mime, src_set=srcset, sizes=sizes)
+            for mime, srcset in entry["sources"].items()
+        ],
+        rx.el.img(
+            src=src,
+            alt=alt,
+            style=style,
+            **props,
+        ),
+    )
@@ -5,11 +5,14 @@ from .header import header, mobile_header
 from .sidebar import sidebar, mobile_sidebar
 from ..state import NavigationState
 from ..styles import get_content_styles, LAYOUT
+from ..utils.highlight import get_highlight_css
 
 
 def layout(children: rx.Component) -> rx.Component:
     """Main layout with sidebar, header, and content area."""
     return rx.box(
+        # Token colors of server-highlighted code blocks
+        rx.el.style(get_highlight_css()),
         # Desktop layout
         rx.desktop_only(
             rx.box(
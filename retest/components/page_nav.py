@@ -3,10 +3,17 @@ import reflex as rx
 from ..state import NavigationState
 
 
-def on_this_page() -> rx.Component:
-    """On this page navigation for internal anchors."""
+def on_this_page(sections: rx.Var | None = None) -> rx.Component:
+    """On this page navigation for internal anchors.
+
+    Args:
+        sections: List var of {"id", "title"} dicts, defaults to the
+            sections registered by ``page_layout``
+    """
+    if sections is None:
+        sections = NavigationState.current_sections
     return rx.cond(
-        NavigationState.current_sections,
+        sections,
         rx.box(
             rx.vstack(
                 rx.heading(
@@ -17,7 +24,7 @@ def on_this_page() -> rx.Component:
                 ),
                 rx.vstack(
                     rx.foreach(
-                        NavigationState.current_sections,
+                        sections,
                         lambda section: rx.link(
                             rx.text(
                                 section["title"],
@@ -102,9 +102,9 @@ def projects_nav() -> rx.Component:
 
 
 def blog_nav() -> rx.Component:
-    """Blog navigation subsection."""
+    """Blog navigation subsection with the newest posts."""
     return rx.foreach(
-        PortfolioState.blog_posts,
+        PortfolioState.recent_blog_posts,
         lambda post: nav_item(
             "file-text",
             post["title"],
@@ -1,5 +1,6 @@
 """About Me page for the portfolio website."""
 import reflex as rx
+from ..components.image import responsive_image
 from ..components.layout import page_layout, footer
 from ..components.page_nav import page_section, tip_box
 from ..state import PortfolioState
@@ -21,11 +22,16 @@ def about_page() -> rx.Component:
         children=rx.vstack(
             # Profile section
             rx.hstack(
-                rx.avatar(
-                    fallback=PortfolioState.name[0],
-                    size="8",
-                    radius="full",
+                responsive_image(
+                    "/profile.jpg",
+                    alt=PortfolioState.name,
+                    sizes="80px",
+                    loading="eager",
                     style={
+                        "width": "80px",
+                        "height": "80px",
+                        "border_radius": "50%",
+                        "object_fit": "cover",
                         "border": f"3px solid {rx.color('blue', 6)}",
                     },
                 ),
@@ -5,6 +5,9 @@ from ..components.layout import page_layout, footer
 from ..components.page_nav import page_section, tip_box
 from ..state import PortfolioState
 
+# Milliseconds between checks for newly published posts
+BLOG_REFRESH_INTERVAL = 60_000
+
 
 def blog_post_card(post: dict) -> rx.Component:
     """Individual blog post card component."""
@@ -80,6 +83,149 @@ def blog_post_card(post: dict) -> rx.Component:
     )
 
 
+def blog_search_result(result: dict) -> rx.Component:
+    """Single search hit with a highlighted snippet."""
+    return rx.link(
+        rx.vstack(
+            rx.heading(result["title"], size="4", weight="medium"),
+            rx.html(
+                result["snippet"].to(str),
+                size="2",
+                color=rx.color("gray", 11),
+                line_height="1.5",
+                style={
+                    "& mark": {
+                        "background_color": rx.color("yellow", 4),
+                        "color": rx.color("gray", 12),
+                        "border_radius": "2px",
+                    },
+                },
+            ),
+            rx.text(
+                result["date"],
+                size="1",
+                color=rx.color("gray", 9),
+            ),
+            spacing="1",
+            align="start",
+            width="100%",
+        ),
+        href=f"/blog/{result['id']}",
+        text_decoration="none",
+        color="inherit",
+        width="100%",
+        padding="1rem",
+        border_radius="8px",
+        _hover={"background_color": rx.color("gray", 3)},
+    )
+
+
+def blog_search_box() -> rx.Component:
+    """Full-text search box with results."""
+    return rx.vstack(
+        rx.input(
+            rx.input.slot(rx.icon("search", size=16)),
+            placeholder="Search posts...",
+            value=PortfolioState.blog_search_query,
+            on_change=PortfolioState.search_blog.debounce(250),
+            size="3",
+            width="100%",
+        ),
+        rx.cond(
+            PortfolioState.blog_search_query,
+            rx.cond(
+                PortfolioState.blog_search_results,
+                rx.vstack(
+                    rx.foreach(
+                        PortfolioState.blog_search_results,
+                        blog_search_result,
+                    ),
+                    spacing="1",
+                    width="100%",
+                    background_color=rx.color("gray", 2),
+                    border=f"1px solid {rx.color('gray', 4)}",
+                    border_radius="12px",
+                ),
+                rx.text(
+                    "No posts match your search.",
+                    size="2",
+                    color=rx.color("gray", 10),
+                ),
+            ),
+            rx.fragment(),
+        ),
+        spacing="3",
+        width="100%",
+    )
+
+
+def blog_tag_cloud() -> rx.Component:
+    """Clickable tags with post counts that filter the blog listing."""
+    return rx.flex(
+        rx.foreach(
+            PortfolioState.blog_tag_counts,
+            lambda tag: rx.button(
+                rx.hstack(
+                    rx.icon("tag", size=14),
+                    rx.text(tag["tag"]),
+                    rx.badge(tag["count"], color_scheme="gray", size="1"),
+                    spacing="2",
+                    align="center",
+                ),
+                size="2",
+                variant=rx.cond(
+                    PortfolioState.blog_tag_filter == tag["tag"], "solid", "soft"
+                ),
+                color_scheme="blue",
+                on_click=PortfolioState.set_blog_tag_filter(tag["tag"]),
+            ),
+        ),
+        wrap="wrap",
+        gap="2",
+        width="100%",
+    )
+
+
+def blog_pagination() -> rx.Component:
+    """Newer/older buttons for the paginated blog listing."""
+    return rx.hstack(
+        rx.button(
+            rx.hstack(
+                rx.icon("arrow-left", size=16),
+                rx.text("Newer Posts"),
+                spacing="2",
+                align="center",
+            ),
+            size="2",
+            variant="outline",
+            color_scheme="blue",
+            disabled=~PortfolioState.blog_previous_cursors,
+            on_click=PortfolioState.previous_blog_page,
+        ),
+        rx.button(
+            rx.hstack(
+                rx.text("Older Posts"),
+                rx.icon("arrow-right", size=16),
+                spacing="2",
+                align="center",
+            ),
+            size="2",
+            variant="outline",
+            color_scheme="blue",
+            disabled=~PortfolioState.blog_next_cursor,
+            on_click=PortfolioState.next_blog_page,
+        ),
+        # Picks up scheduled posts once they go live, without a page reload
+        rx.moment(
+            interval=BLOG_REFRESH_INTERVAL,
+            on_change=PortfolioState.refresh_blog_index,
+            display="none",
+        ),
+        justify="between",
+        width="100%",
+    )
+
+
 def blog_page() -> rx.Component:
     """Blog page content."""
     # Define page sections for navigation
@@ -134,15 +280,20 @@ def blog_page() -> rx.Component:
                 title="Recent Posts",
                 id="recent",
                 children=rx.vstack(
+                    # Full-text search
+                    blog_search_box(),
+                    # Tag filter
+                    blog_tag_cloud(),
                     # Blog posts grid
                     rx.vstack(
                         rx.foreach(
-                            PortfolioState.blog_posts,
+                            PortfolioState.blog_page_posts,
                             blog_post_card,
                         ),
                         spacing="4",
                         width="100%",
                     ),
+                    blog_pagination(),
                     # View all posts
                     rx.box(
                         rx.vstack(
@@ -205,6 +356,8 @@ def blog_page() -> rx.Component:
                         color=rx.color("gray", 11),
                         line_height="1.6",
                     ),
+                    # Tags used in posts, with post counts
+                    blog_tag_cloud(),
                     # Topic categories
                     rx.grid(
                         # Web Development
@@ -1,37 +1,69 @@
 """Individual blog post page."""
 
 import reflex as rx
-from ..utils.blog import get_blog_post_by_id
+from ..utils.blog_backend import get_blog_backend
+from ..utils.blog_render import render_markdown
 
 
 class BlogPostState(rx.State):
     """State for handling individual blog post."""
 
-    @rx.var
-    def current_post(self) -> dict | None:
+    def _current_post(self) -> dict | None:
         """Get the current blog post based on the post_id URL parameter."""
         # Access the post_id directly - Reflex automatically creates this computed var for dynamic routes
         post_id = self.post_id
         if post_id:
-            return get_blog_post_by_id(post_id)
+            # Served from the shared index and body cache (or an indexed lookup), so repeated calls are cheap
+            return get_blog_backend().get_post(post_id)
         return None
 
+    @rx.var
+    def post_found(self) -> bool:
+        """Whether the post_id URL parameter matches a blog post."""
+        return self._current_post() is not None
+
     @rx.var
     def post_title(self) -> str:
         """Get the title of the current post."""
-        post = self.current_post
+        post = self._current_post()
         return post.get("title", "Post Not Found") if post else "Post Not Found"
 
     @rx.var
-    def post_content(self) -> str:
-        """Get the content of the current post."""
-        post = self.current_post
-        return post.get("content", "") if post else ""
+    def post_html(self) -> str:
+        """Get the content of the current post, rendered to HTML on the server."""
+        post = self._current_post()
+        return render_markdown(post.get("content", "")) if post else ""
+
+    @rx.var
+    def post_toc(self) -> list[dict[str, str]]:
+        """Get the table of contents of the current post (extracted by the indexer)."""
+        post = self._current_post()
+        if not post:
+            return []
+        return [{"id": entry["id"], "title": entry["title"]} for entry in post.get("toc", [])]
+
+    @rx.var
+    def related_posts(self) -> list[dict]:
+        """Get the summaries of the posts most related to the current post (precomputed)."""
+        post_id = self.post_id
+        return get_blog_backend().related_posts(post_id) if post_id else []
+
+    @rx.var
+    def newer_post(self) -> dict[str, str]:
+        """Get the ID and title of the next newer post (empty if none)."""
+        newer, _ = get_blog_backend().adjacent_posts(self.post_id) if self.post_id else (None, None)
+        return {"id": newer["id"], "title": str(newer["title"])} if newer else {}
+
+    @rx.var
+    def older_post(self) -> dict[str, str]:
+        """Get the ID and title of the next older post (empty if none)."""
+        _, older = get_blog_backend().adjacent_posts(self.post_id) if self.post_id else (None, None)
+        return {"id": older["id"], "title": str(older["title"])} if older else {}
 
     @rx.var
     def post_excerpt(self) -> str:
         """Get the excerpt of the current post."""
-        post = self.current_post
+        post = self._current_post()
         return post.get("excerpt", "") if post else ""
 
 
@@ -108,11 +140,11 @@ def blog_post_header(post: dict) -> rx.Component:
     )
 
 
-def blog_post_content(content: str) -> rx.Component:
-    """Render the blog post content (markdown)."""
+def blog_post_content(html: str) -> rx.Component:
+    """Render the blog post content (HTML pre-rendered from markdown)."""
     return rx.box(
-        rx.markdown(
-            content,
+        rx.html(
+            html,
             style={
                 "& h1": {
                     "font_size": "2rem",
@@ -155,6 +187,12 @@ def blog_post_content(content: str) -> rx.Component:
                     "border_radius": "4px",
                     "font_size": "0.9rem",
                 },
+                "& pre code": {
+                    "background_color": "transparent",
+                    "color": rx.color("gray", 12),
+                    "padding": "0",
+                    "border_radius": "0",
+                },
                 "& pre": {
                     "background_color": rx.color("gray", 2),
                     "border": f"1px solid {rx.color('gray', 4)}",
@@ -163,6 +201,11 @@ def blog_post_content(content: str) -> rx.Component:
                     "overflow_x": "auto",
                     "margin": "1rem 0",
                 },
+                "& img": {
+                    "max_width": "100%",
+                    "height": "auto",
+                    "border_radius": "8px",
+                },
                 "& blockquote": {
                     "border_left": f"4px solid {rx.color('iris', 6)}",
                     "padding_left": "1rem",
@@ -183,10 +226,79 @@ def blog_post_content(content: str) -> rx.Component:
     )
 
 
+def blog_related_posts() -> rx.Component:
+    """Links to the posts most related to the current one."""
+    return rx.cond(
+        BlogPostState.related_posts,
+        rx.vstack(
+            rx.heading("Related posts", size="5", weight="medium", color=rx.color("gray", 12)),
+            rx.foreach(
+                BlogPostState.related_posts,
+                lambda post: rx.link(
+                    rx.hstack(
+                        rx.text(post["title"], size="3", weight="medium"),
+                        rx.spacer(),
+                        rx.text(post["date"], size="1", color=rx.color("gray", 9)),
+                        align="center",
+                        width="100%",
+                    ),
+                    href=f"/blog/{post['id']}",
+                    text_decoration="none",
+                    color="inherit",
+                    width="100%",
+                    padding="0.75rem 1rem",
+                    border_radius="8px",
+                    _hover={"background_color": rx.color("gray", 3)},
+                ),
+            ),
+            spacing="2",
+            align="start",
+            width="100%",
+            margin_top="3rem",
+        ),
+        rx.fragment(),
+    )
+
+
 def blog_post_navigation() -> rx.Component:
     """Navigation at the bottom of the blog post."""
     return rx.vstack(
         rx.divider(),
+        # Neighbours in the date order, looked up in the blog index
+        rx.hstack(
+            rx.cond(
+                BlogPostState.older_post,
+                rx.link(
+                    rx.hstack(
+                        rx.icon("chevron-left", size=16),
+                        rx.text(BlogPostState.older_post["title"], size="2"),
+                        spacing="1",
+                        align="center",
+                    ),
+                    href=f"/blog/{BlogPostState.older_post['id']}",
+                    color=rx.color("gray", 11),
+                    text_decoration="none",
+                ),
+                rx.box(),
+            ),
+            rx.cond(
+                BlogPostState.newer_post,
+                rx.link(
+                    rx.hstack(
+                        rx.text(BlogPostState.newer_post["title"], size="2"),
+                        rx.icon("chevron-right", size=16),
+                        spacing="1",
+                        align="center",
+                    ),
+                    href=f"/blog/{BlogPostState.newer_post['id']}",
+                    color=rx.color("gray", 11),
+                    text_decoration="none",
+                ),
+                rx.box(),
+            ),
+            justify="between",
+            width="100%",
+        ),
         rx.hstack(
             rx.link(
                 rx.button(
@@ -227,11 +339,12 @@ def blog_post_navigation() -> rx.Component:
 def blog_post_page() -> rx.Component:
     """Individual blog post page that loads content dynamically from markdown files."""
     from ..components.layout import layout
+    from ..components.page_nav import on_this_page
 
     # Use conditional rendering based on whether post exists
     return layout(
         rx.cond(
-            BlogPostState.current_post,
+            BlogPostState.post_found,
             # Post found - render it
             rx.vstack(
                 # Page title (dynamic)
@@ -254,78 +367,12 @@ def blog_post_page() -> rx.Component:
                     ),
                     rx.fragment(),
                 ),
-                # Blog post content (inline markdown)
-                rx.box(
-                    rx.markdown(
-                        BlogPostState.post_content,
-                        style={
-                            "& h1": {
-                                "font_size": "2rem",
-                                "font_weight": "bold",
-                                "margin_top": "2rem",
-                                "margin_bottom": "1rem",
-                                "color": rx.color("gray", 12),
-                            },
-                            "& h2": {
-                                "font_size": "1.5rem",
-                                "font_weight": "600",
-                                "margin_top": "1.5rem",
-                                "margin_bottom": "0.75rem",
-                                "color": rx.color("gray", 12),
-                            },
-                            "& h3": {
-                                "font_size": "1.25rem",
-                                "font_weight": "600",
-                                "margin_top": "1.25rem",
-                                "margin_bottom": "0.5rem",
-                                "color": rx.color("gray", 12),
-                            },
-                            "& p": {
-                                "line_height": "1.7",
-                                "margin_bottom": "1rem",
-                                "color": rx.color("gray", 11),
-                            },
-                            "& ul, & ol": {
-                                "margin_left": "1.5rem",
-                                "margin_bottom": "1rem",
-                            },
-                            "& li": {
-                                "margin_bottom": "0.5rem",
-                                "color": rx.color("gray", 11),
-                            },
-                            "& code": {
-                                "background_color": rx.color("gray", 3),
-                                "color": rx.color("iris", 11),
-                                "padding": "0.2rem 0.4rem",
-                                "border_radius": "4px",
-                                "font_size": "0.9rem",
-                            },
-                            "& pre": {
-                                "background_color": rx.color("gray", 2),
-                                "border": f"1px solid {rx.color('gray', 4)}",
-                                "border_radius": "8px",
-                                "padding": "1rem",
-                                "overflow_x": "auto",
-                                "margin": "1rem 0",
-                            },
-                            "& blockquote": {
-                                "border_left": f"4px solid {rx.color('iris', 6)}",
-                                "padding_left": "1rem",
-                                "margin": "1rem 0",
-                                "font_style": "italic",
-                                "color": rx.color("gray", 10),
-                            },
-                            "& a": {
-                                "color": rx.color("iris", 11),
-                                "text_decoration": "underline",
-                            },
-                            "& a:hover": {
-                                "color": rx.color("iris", 12),
-                            },
-                        },
-                    ),
-                    width="100%",
-                ),
+                # Table of contents with the heading anchors of the post
+                on_this_page(BlogPostState.post_toc),
+                # Blog post content (pre-rendered HTML)
+                blog_post_content(BlogPostState.post_html),
+                # Related posts (precomputed by the related posts index)
+                blog_related_posts(),
                 # Navigation
                 blog_post_navigation(),
                 spacing="4",
@@ -136,8 +136,7 @@ def skills_page() -> rx.Component:
                         line_height="1.6",
                     ),
                     code_block(
-                        """```python
-# Example: Clean API endpoint with proper error handling
+                        """# Example: Clean API endpoint with proper error handling
 from fastapi import FastAPI, HTTPException, Depends
 from sqlalchemy.orm import Session
 from typing import List
@@ -162,8 +161,9 @@ async def get_projects(
             status_code=500, 
             detail="Internal server error"
         )
-```""",
+""",
                         language="python",
+                        show_line_numbers=True,
                         filename="api/projects.py",
                         github_url="https://github.com/username/portfolio-api",
                     ),
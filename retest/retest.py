@@ -9,6 +9,11 @@ from .pages import (
     contact_page,
 )
 from .pages.blog_post import blog_post_page
+from .state import PortfolioState
+from .utils.blog_backend import BLOG_BACKEND
+from .utils.blog_feeds import blog_feed_api
+from .utils.blog_sitemap import blog_sitemap_api, keep_blog_sitemap_fresh
+from .utils.blog_watcher import watch_blog_posts
 
 # Set app styles
 app = rx.App(
@@ -18,12 +23,27 @@ app = rx.App(
         radius="medium",
         scaling="100%",
     ),
+    # Blog feeds (with conditional GET support) and the sitemap are served by
+    # the backend, so they follow blog changes without a rebuild
+    api_transformer=[blog_feed_api, blog_sitemap_api],
 )
 
 # Add pages to the app
 app.add_page(about_page, route="/", title="About - Alex Portfolio")
 app.add_page(projects_page, route="/projects", title="Projects - Alex Portfolio")
 app.add_page(skills_page, route="/skills", title="Skills - Alex Portfolio")
-app.add_page(blog_page, route="/blog", title="Blog - Alex Portfolio")
+app.add_page(
+    blog_page,
+    route="/blog",
+    title="Blog - Alex Portfolio",
+    on_load=PortfolioState.load_blog_page,
+)
 app.add_page(blog_post_page, route="/blog/[post_id]", title="Blog Post - Alex Portfolio")
 app.add_page(contact_page, route="/contact", title="Contact - Alex Portfolio")
+
+# Keep the shared blog index in sync with the markdown files (the SQLite
+# backend never loads them, its database is updated by re-importing)
+if BLOG_BACKEND == "markdown":
+    app.register_lifespan_task(watch_blog_posts)
+# Rewrite the dev server's sitemap files after blog changes
+app.register_lifespan_task(keep_blog_sitemap_fresh)
@@ -2,7 +2,11 @@
 
 import reflex as rx
 from typing import Dict, List, Union, Any
-from .utils.blog import load_all_blog_posts
+from .utils.blog_backend import get_blog_backend
+
+
+# Number of newest posts linked from the sidebar
+SIDEBAR_BLOG_POSTS = 5
 
 
 class NavigationState(rx.State):
@@ -88,35 +92,99 @@ class PortfolioState(rx.State):
         "Tools": ["Docker", "Git", "VS Code"],
     }
 
-    # Blog posts data - loaded from markdown files
-    _blog_posts: List[Dict[str, Union[str, List[str]]]] = []
-    _blog_posts_loaded: bool = False
+    # Version of the blog content the client last saw; the computed vars below
+    # depend on it so they are recomputed when scheduled posts go live.
+    blog_index_version: int = 0
+
+    # Blog post summaries - served by the process-wide blog backend.
+    # Full post bodies are only loaded by BlogPostState on /blog/[post_id],
+    # and the client only ever holds one page of summaries.
+    @rx.var
+    def recent_blog_posts(self) -> List[Dict[str, Union[str, List[str]]]]:
+        """Get the newest blog post summaries for the sidebar."""
+        _ = self.blog_index_version
+        try:
+            return get_blog_backend().recent_posts(SIDEBAR_BLOG_POSTS)
+        except Exception as e:
+            print(f"Error loading blog posts: {e}")
+            return []
+
+    # Tag selected in the blog listing ("" shows every post)
+    blog_tag_filter: str = ""
 
     @rx.var
-    def blog_posts(self) -> List[Dict[str, Union[str, List[str]]]]:
-        """Get blog posts, loading them if necessary."""
-        if not self._blog_posts_loaded:
-            try:
-                self._blog_posts = load_all_blog_posts()
-                self._blog_posts_loaded = True
-            except Exception as e:
-                print(f"Error loading blog posts: {e}")
-                self._blog_posts = []
-        return self._blog_posts
-
-    def load_blog_posts(self):
-        """Load blog posts from markdown files."""
-        if not self._blog_posts_loaded:
-            try:
-                self._blog_posts = load_all_blog_posts()
-                self._blog_posts_loaded = True
-            except Exception as e:
-                print(f"Error loading blog posts: {e}")
-                # Fallback to empty list if loading fails
-                self._blog_posts = []
-
-    def get_blog_posts(self) -> List[Dict[str, Union[str, List[str]]]]:
-        """Get blog posts, loading them if necessary."""
-        if not self._blog_posts_loaded:
-            self.load_blog_posts()
-        return self._blog_posts
+    def blog_tag_counts(self) -> List[Dict[str, Union[str, int]]]:
+        """Get every blog tag with its post count from the tag index."""
+        _ = self.blog_index_version
+        try:
+            return [
+                {"tag": tag, "count": count}
+                for tag, count in get_blog_backend().tag_counts().items()
+            ]
+        except Exception as e:
+            print(f"Error loading blog tags: {e}")
+            return []
+
+    # Current page of the blog listing and the cursors to page through it
+    blog_page_posts: List[Dict[str, Union[str, List[str]]]] = []
+    blog_page_cursor: str = ""
+    blog_next_cursor: str = ""
+    blog_previous_cursors: List[str] = []
+
+    def _show_blog_page(self, cursor: str):
+        """Load the page of summaries that starts after the cursor."""
+        try:
+            backend = get_blog_backend()
+            self.blog_index_version = backend.version()
+            posts, next_cursor = backend.get_page(cursor, self.blog_tag_filter)
+        except Exception as e:
+            print(f"Error loading blog posts: {e}")
+            posts, next_cursor = [], ""
+        self.blog_page_posts = posts
+        self.blog_page_cursor = cursor
+        self.blog_next_cursor = next_cursor
+
+    def load_blog_page(self):
+        """Show the first page of the blog listing."""
+        self.blog_previous_cursors = []
+        self._show_blog_page("")
+
+    def refresh_blog_index(self, _tick: str = ""):
+        """Reload the current page if posts were published since it was loaded.
+
+        Called periodically by the blog page; a version comparison when
+        nothing changed.
+        """
+        if get_blog_backend().version() != self.blog_index_version:
+            self._show_blog_page(self.blog_page_cursor)
+
+    def next_blog_page(self):
+        """Show the next page of the blog listing."""
+        if self.blog_next_cursor:
+            self.blog_previous_cursors = self.blog_previous_cursors + [self.blog_page_cursor]
+            self._show_blog_page(self.blog_next_cursor)
+
+    def previous_blog_page(self):
+        """Show the previous page of the blog listing."""
+        if self.blog_previous_cursors:
+            cursor = self.blog_previous_cursors[-1]
+            self.blog_previous_cursors = self.blog_previous_cursors[:-1]
+            self._show_blog_page(cursor)
+
+    def set_blog_tag_filter(self, tag: str):
+        """Filter the blog listing by tag; selecting the same tag clears it."""
+        self.blog_tag_filter = "" if tag == self.blog_tag_filter else tag
+        self.load_blog_page()
+
+    # Blog full-text search
+    blog_search_query: str = ""
+    blog_search_results: List[Dict[str, Union[str, float, List[str]]]] = []
+
+    def search_blog(self, query: str):
+        """Search the blog posts with the backend's full-text index."""
+        self.blog_search_query = query
+        try:
+            self.blog_search_results = get_blog_backend().search(query) if query.strip() else []
+        except Exception as e:
+            print(f"Error searching blog posts: {e}")
+            self.blog_search_results = []
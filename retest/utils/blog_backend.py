@@ -0,0 +1,153 @@
+"""Pluggable content backends serving the blog to the app state.
+
+The app state and pages query posts through ``get_blog_backend()``:
+
+- ``markdown`` (default): the in-memory index built from the markdown
+  directory (``retest.utils.blog``), with the BM25 search index and the
+  precomputed related posts.
+- ``sqlite``: a SQLite database with an FTS5 index, filled by
+  ``python -m retest.utils.blog_sqlite`` (see that module). Nothing is
+  loaded into memory at startup; every query is an indexed lookup.
+
+Select the backend with the ``BLOG_BACKEND`` environment variable. Every
+method returns plain dicts, as the state expects. Both backends hide
+unpublished drafts and posts scheduled for later from every listing, and
+serve drafts (but not scheduled posts) by direct ID.
+"""
+
+import os
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+from .blog import (
+    BLOG_PAGE_SIZE,
+    get_adjacent_blog_posts,
+    get_blog_index,
+    get_blog_page,
+    get_blog_post_by_id,
+    get_blog_posts_by_tag,
+)
+from .blog_record import records_to_dicts
+
+BLOG_BACKEND = os.getenv("BLOG_BACKEND", "markdown")
+
+
+class BlogBackend(ABC):
+    """Queries the app needs from a blog content store."""
+
+    @abstractmethod
+    def version(self) -> int:
+        """Get a number that changes whenever the published posts change."""
+
+    @abstractmethod
+    def get_post(self, post_id: str) -> Optional[Dict]:
+        """Get a post with its "content", or None if there is no such post."""
+
+    @abstractmethod
+    def recent_posts(self, limit: int) -> List[Dict]:
+        """Get the summaries of the newest posts."""
+
+    @abstractmethod
+    def post_records(self, limit: Optional[int] = None) -> List[Dict]:
+        """Get every field but the body of the newest posts (all of them by default)."""
+
+    @abstractmethod
+    def get_page(
+        self, cursor: str = "", tag: str = "", limit: int = BLOG_PAGE_SIZE
+    ) -> Tuple[List[Dict], str]:
+        """Get a page of summaries after a cursor, see ``blog.get_blog_page``."""
+
+    @abstractmethod
+    def posts_by_tag(self, tag: str) -> List[Dict]:
+        """Get the summaries of the posts with a tag, newest first."""
+
+    @abstractmethod
+    def posts_between(self, start: date, end: date) -> List[Dict]:
+        """Get the summaries of the posts dated from start to end (inclusive), newest first."""
+
+    @abstractmethod
+    def tag_counts(self) -> Dict[str, int]:
+        """Get the number of posts per tag, sorted by tag."""
+
+    @abstractmethod
+    def adjacent_posts(self, post_id: str) -> Tuple[Optional[Dict], Optional[Dict]]:
+        """Get the summaries of the next newer and next older post."""
+
+    @abstractmethod
+    def related_posts(self, post_id: str) -> List[Dict]:
+        """Get the summaries of the posts most related to a post."""
+
+    @abstractmethod
+    def search(self, query: str, limit: int = 10) -> List[Dict]:
+        """Search the posts; summaries with a "score" and an HTML "snippet"."""
+
+
+class MarkdownBlogBackend(BlogBackend):
+    """Backend over the in-memory index of the markdown directory."""
+
+    def version(self) -> int:
+        return get_blog_index().version
+
+    def get_post(self, post_id: str) -> Optional[Dict]:
+        return get_blog_post_by_id(post_id)
+
+    def recent_posts(self, limit: int) -> List[Dict]:
+        return records_to_dicts(get_blog_index().summaries[:limit])
+
+    def post_records(self, limit: Optional[int] = None) -> List[Dict]:
+        return records_to_dicts(get_blog_index().posts[:limit])
+
+    def get_page(
+        self, cursor: str = "", tag: str = "", limit: int = BLOG_PAGE_SIZE
+    ) -> Tuple[List[Dict], str]:
+        return get_blog_page(cursor, tag, limit)
+
+    def posts_by_tag(self, tag: str) -> List[Dict]:
+        return get_blog_posts_by_tag(tag)
+
+    def posts_between(self, start: date, end: date) -> List[Dict]:
+        index = get_blog_index()
+        # Sort keys start with the negated date ordinal, so the range is one slice
+        low = bisect_left(index.sort_keys, (-end.toordinal(),))
+        high = bisect_left(index.sort_keys, (-start.toordinal() + 1,))
+        return records_to_dicts(index.summaries[low:high])
+
+    def tag_counts(self) -> Dict[str, int]:
+        return get_blog_index().tag_counts()
+
+    def adjacent_posts(self, post_id: str) -> Tuple[Optional[Dict], Optional[Dict]]:
+        return get_adjacent_blog_posts(post_id)
+
+    def related_posts(self, post_id: str) -> List[Dict]:
+        from .blog_related import get_related_posts
+
+        return get_related_posts(post_id)
+
+    def search(self, query: str, limit: int = 10) -> List[Dict]:
+        from .blog_search import search_blog_posts
+
+        return search_blog_posts(query, limit)
+
+
+_blog_backend: Optional[BlogBackend] = None
+
+
+def get_blog_backend() -> BlogBackend:
+    """Get the content backend selected by ``BLOG_BACKEND``.
+
+    Returns:
+        The process-wide backend instance
+    """
+    global _blog_backend
+
+    if _blog_backend is None:
+        if BLOG_BACKEND == "sqlite":
+            from .blog_sqlite import SqliteBlogBackend
+
+            _blog_backend = SqliteBlogBackend()
+        elif BLOG_BACKEND == "markdown":
+            _blog_backend = MarkdownBlogBackend()
+        else:
+            raise ValueError(f"Unknown blog backend: {BLOG_BACKEND}")
+    return _blog_backend
@@ -0,0 +1,172 @@
+"""Compressed in-memory store of blog post bodies.
+
+Markdown bodies are mostly read once (by the search and related-posts
+indexers) and then rarely, so keeping them as text wastes memory. The
+store keeps them zlib-compressed against a dictionary shared by all posts
+(trained from a sample of bodies, so short posts compress as well as long
+ones) and decompresses on demand. Recently opened posts are served as text
+by the small LRU body cache in front of it.
+
+The store is bounded by a byte budget; the least recently used bodies are
+dropped when it is exceeded and read from the blog pack or markdown file
+again when needed.
+"""
+
+import re
+import threading
+import time
+import zlib
+from collections import Counter, OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+
+# zlib only looks back 32 KiB, so a longer dictionary is never used
+SHARED_DICTIONARY_SIZE = 32 * 1024
+BODY_COMPRESSION_LEVEL = 9
+
+_DICTIONARY_TERM = re.compile(r"\S{3,}")
+
+
+def build_shared_dictionary(samples: Iterable[str], size: int = SHARED_DICTIONARY_SIZE) -> bytes:
+    """Build a zlib preset dictionary from sample post bodies.
+
+    Args:
+        samples: Bodies to learn from
+        size: Maximum dictionary size in bytes
+
+    Returns:
+        The terms found in more than one sample, the most valuable last
+        (zlib finds matches near the end of the dictionary most cheaply)
+    """
+    document_frequency = Counter()
+    for body in samples:
+        document_frequency.update(set(_DICTIONARY_TERM.findall(body)))
+
+    terms = []
+    total = 0
+    ranked = sorted(
+        document_frequency.items(),
+        key=lambda item: (item[1] * len(item[0]), item[0]),
+        reverse=True,
+    )
+    for term, frequency in ranked:
+        if frequency < 2:
+            continue
+        length = len(term.encode("utf-8")) + 1
+        if total + length > size:
+            break
+        terms.append(term)
+        total += length
+    return " ".join(reversed(terms)).encode("utf-8")
+
+
+class CompressedBodyStore:
+    """Budgeted LRU store of compressed post bodies with usage metrics.
+
+    Entries are keyed by post ID and remember the file signature they were
+    read with, so an edited post is never served from a stale entry.
+    """
+
+    def __init__(self, budget: int):
+        self.budget = budget
+        self.size = 0
+        self.raw_size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.decompressions = 0
+        self.decompress_seconds = 0.0
+        self.decompress_max_seconds = 0.0
+        self.dictionary: Optional[bytes] = None
+        # post_id -> (signature, compressed body, uncompressed size)
+        self._bodies: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def set_dictionary(self, dictionary: bytes) -> None:
+        """Use a new shared dictionary (drops bodies compressed with the old one)."""
+        with self._lock:
+            self.dictionary = dictionary
+            self._bodies.clear()
+            self.size = 0
+            self.raw_size = 0
+
+    def get(self, post_id: str, signature: Optional[Tuple]) -> Optional[str]:
+        """Decompress a stored body, if it was stored for this file signature."""
+        with self._lock:
+            entry = self._bodies.get(post_id)
+            if entry is None or entry[0] != signature:
+                self.misses += 1
+                return None
+            self._bodies.move_to_end(post_id)
+            self.hits += 1
+            dictionary = self.dictionary
+
+        start = time.perf_counter()
+        decompressor = zlib.decompressobj(zdict=dictionary) if dictionary else zlib.decompressobj()
+        body = (decompressor.decompress(entry[1]) + decompressor.flush()).decode("utf-8")
+        elapsed = time.perf_counter() - start
+
+        with self._lock:
+            self.decompressions += 1
+            self.decompress_seconds += elapsed
+            self.decompress_max_seconds = max(self.decompress_max_seconds, elapsed)
+        return body
+
+    def put(self, post_id: str, signature: Optional[Tuple], body: str) -> None:
+        """Compress and store a body, evicting the least recently used over budget."""
+        if self.budget <= 0:
+            return
+        raw = body.encode("utf-8")
+        dictionary = self.dictionary
+        if dictionary:
+            compressor = zlib.compressobj(BODY_COMPRESSION_LEVEL, zdict=dictionary)
+        else:
+            compressor = zlib.compressobj(BODY_COMPRESSION_LEVEL)
+        blob = compressor.compress(raw) + compressor.flush()
+        if len(blob) > self.budget:
+            return
+
+        with self._lock:
+            # The dictionary was replaced while compressing
+            if dictionary is not self.dictionary:
+                return
+            self._discard(post_id)
+            self._bodies[post_id] = (signature, blob, len(raw))
+            self.size += len(blob)
+            self.raw_size += len(raw)
+            while self.size > self.budget:
+                _, (_, evicted, evicted_raw) = self._bodies.popitem(last=False)
+                self.size -= len(evicted)
+                self.raw_size -= evicted_raw
+                self.evictions += 1
+
+    def _discard(self, post_id: str) -> None:
+        """Drop a post's entry (the lock must be held)."""
+        entry = self._bodies.pop(post_id, None)
+        if entry is not None:
+            self.size -= len(entry[1])
+            self.raw_size -= entry[2]
+
+    def discard(self, post_id: str) -> None:
+        """Drop the stored body of a post, e.g. after its file changed."""
+        with self._lock:
+            self._discard(post_id)
+
+    def stats(self) -> Dict[str, float]:
+        """Get the store's size, compression ratio and decompression latency."""
+        with self._lock:
+            return {
+                "entries": len(self._bodies),
+                "size": self.size,
+                "raw_size": self.raw_size,
+                "budget": self.budget,
+                "dictionary_size": len(self.dictionary or b""),
+                "compression_ratio": round(self.raw_size / self.size, 2) if self.size else 0.0,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "decompressions": self.decompressions,
+                "decompress_avg_ms": round(
+                    1000 * self.decompress_seconds / self.decompressions, 3
+                ) if self.decompressions else 0.0,
+                "decompress_max_ms": round(1000 * self.decompress_max_seconds, 3),
+            }
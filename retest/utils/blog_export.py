@@ -0,0 +1,201 @@
+"""Static export of every blog post page.
+
+``python -m retest.utils.blog_export [OUTPUT_DIR]`` writes a fully rendered
+``blog/<post_id>/index.html`` for each published post, so posts can be
+served by a CDN or any static file server without the backend. A manifest
+records the source signature, image variants manifest and output hash of
+every page; re-running the export only renders posts whose markdown file
+(or the image variants) changed and removes pages of deleted posts.
+"""
+
+import hashlib
+import html
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Dict, Optional
+from .blog import BlogIndex, get_blog_index, read_blog_post_body
+from .blog_render import render_markdown
+from .highlight import get_highlight_css
+from .images import get_image_manifest_hash
+
+# Bump when the page template or rendering changes, to re-render every post
+EXPORT_VERSION = 1
+MANIFEST_NAME = "blog_manifest.json"
+
+_PAGE_STYLE = """
+body { margin: 0; font-family: system-ui, sans-serif; line-height: 1.7; color: #1c2024; background: #fff; }
+.dark body { color: #edeef0; background: #111113; }
+main { max-width: 800px; margin: 0 auto; padding: 2rem 1rem; }
+h1, h2, h3 { line-height: 1.2; }
+a { color: #5151cd; }
+.meta, .excerpt { color: #60646c; }
+.tags span { display: inline-block; margin-right: 0.25rem; padding: 0 0.4rem; border-radius: 4px; background: #e6f4fe; font-size: 0.8rem; }
+nav.toc { border: 1px solid #d9d9e0; border-radius: 8px; padding: 1rem 1.5rem; margin: 2rem 0; }
+pre { border: 1px solid #d9d9e0; border-radius: 8px; padding: 1rem; overflow-x: auto; }
+blockquote { border-left: 4px solid #9b9ef0; margin: 1rem 0; padding-left: 1rem; font-style: italic; }
+"""
+
+# Follow the reader's color scheme, as the app's "inherit" appearance does
+_COLOR_SCHEME_SCRIPT = (
+    "if (matchMedia('(prefers-color-scheme: dark)').matches) "
+    "document.documentElement.className = 'dark';"
+)
+
+
+def get_blog_export_directory() -> Path:
+    """Get the default export directory (override with BLOG_EXPORT_DIR)."""
+    path = os.getenv("BLOG_EXPORT_DIR")
+    if path:
+        return Path(path)
+    return Path(__file__).parent.parent.parent / "blog_export"
+
+
+def render_blog_post_page(post: Dict, body: str) -> str:
+    """Render the standalone HTML page of a blog post.
+
+    Args:
+        post: Indexed blog post record
+        body: Markdown body of the post
+
+    Returns:
+        Complete HTML document
+    """
+    title = html.escape(str(post.get("title", "")))
+    excerpt = html.escape(str(post.get("excerpt", "")))
+    meta = " • ".join(
+        html.escape(str(post.get(field, "")))
+        for field in ("date", "read_time", "author")
+        if post.get(field)
+    )
+    tags = "".join(f"<span>{html.escape(str(tag))}</span>" for tag in post.get("tags") or [])
+    toc = "".join(
+        f'<li><a href="#{html.escape(entry["id"])}">{html.escape(entry["title"])}</a></li>'
+        for entry in post.get("toc", [])
+    )
+
+    return f"""<!DOCTYPE html>
+<html lang="en" class="light">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title} - Alex Portfolio</title>
+<meta name="description" content="{excerpt}">
+<script>{_COLOR_SCHEME_SCRIPT}</script>
+<style>{_PAGE_STYLE}{get_highlight_css()}</style>
+</head>
+<body>
+<main>
+<h1>{title}</h1>
+<p class="meta">{meta}</p>
+<p class="tags">{tags}</p>
+{f'<p class="excerpt"><em>{excerpt}</em></p>' if excerpt else ""}
+{f'<nav class="toc"><strong>On this page</strong><ul>{toc}</ul></nav>' if toc else ""}
+<article>
+{render_markdown(body)}
+</article>
+<p><a href="/blog">← Back to Blog</a></p>
+</main>
+</body>
+</html>
+"""
+
+
+def _load_manifest(path: Path) -> Dict:
+    """Read the manifest of a previous export, empty if missing or outdated."""
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("version") != EXPORT_VERSION:
+        return {}
+    return manifest.get("posts", {})
+
+
+def export_blog_posts(
+    output_dir: Optional[Path] = None,
+    index: Optional[BlogIndex] = None,
+) -> Dict[str, int]:
+    """Write the static page of every published post, skipping unchanged ones.
+
+    Args:
+        output_dir: Export root, defaults to ``get_blog_export_directory()``
+        index: Blog index to export, defaults to the current shared index
+
+    Returns:
+        Number of "written", "unchanged" and "removed" pages
+    """
+    output_dir = output_dir or get_blog_export_directory()
+    index = index or get_blog_index(force_check=True)
+    manifest_path = output_dir / MANIFEST_NAME
+    previous = _load_manifest(manifest_path)
+    # Pages embed the <picture> markup of the image variants
+    images = get_image_manifest_hash()
+
+    manifest: Dict[str, Dict] = {}
+    counts = {"written": 0, "unchanged": 0, "removed": 0}
+
+    for post in index.posts:
+        post_id = post["id"]
+        page_path = output_dir / "blog" / post_id / "index.html"
+        source = list(index.post_signature(post_id) or ())
+
+        entry = previous.get(post_id)
+        if (
+            entry
+            and entry["source"] == source
+            and entry.get("images") == images
+            and page_path.exists()
+        ):
+            manifest[post_id] = entry
+            counts["unchanged"] += 1
+            continue
+
+        body = read_blog_post_body(index, post_id)
+        if body is None:
+            continue
+        page = render_blog_post_page(post, body).encode("utf-8")
+
+        page_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = page_path.with_name(page_path.name + ".tmp")
+        tmp_path.write_bytes(page)
+        os.replace(tmp_path, page_path)
+        manifest[post_id] = {
+            "source": source,
+            "images": images,
+            "hash": hashlib.sha256(page).hexdigest(),
+        }
+        counts["written"] += 1
+
+    # Pages of deleted or unpublished posts
+    for post_id in previous.keys() - manifest.keys():
+        page_path = output_dir / "blog" / post_id / "index.html"
+        try:
+            page_path.unlink()
+            page_path.parent.rmdir()
+        except OSError:
+            pass
+        counts["removed"] += 1
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path.write_text(
+        json.dumps({"version": EXPORT_VERSION, "posts": manifest}, indent=1),
+        encoding="utf-8",
+    )
+    return counts
+
+
+def main() -> None:
+    """Export the blog from the command line."""
+    output_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else None
+    counts = export_blog_posts(output_dir)
+    print(
+        f"Exported blog to {output_dir or get_blog_export_directory()}: "
+        f"{counts['written']} written, {counts['unchanged']} unchanged, "
+        f"{counts['removed']} removed"
+    )
+
+
+if __name__ == "__main__":
+    main()
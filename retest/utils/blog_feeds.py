@@ -0,0 +1,299 @@
+"""RSS, Atom and JSON feeds of the newest blog posts.
+
+Feeds are read from the selected blog backend, generated once per backend
+version and kept as raw and gzip-compressed bytes. They are served with ETag and Last-Modified
+headers, so polling feed readers mostly get an empty 304 response.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, List, Mapping, Optional, Sequence
+from xml.sax.saxutils import escape
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+from .blog import parse_post_date, post_last_modified
+from .blog_backend import get_blog_backend
+
+# Number of newest posts listed in each feed
+FEED_SIZE = 20
+FEED_TITLE = "Alex Portfolio - Blog"
+FEED_DESCRIPTION = "Posts from the Alex Portfolio blog"
+# Seconds feed readers and proxies may reuse a feed before revalidating
+FEED_MAX_AGE = 300
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def get_site_url() -> str:
+    """Get the public URL of the site, without a trailing slash."""
+    return (os.getenv("REFLEX_DEPLOY_URL") or "http://localhost:3000").rstrip("/")
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat a naive post date as UTC (and missing dates as the epoch)."""
+    if value == datetime.min:
+        return _EPOCH
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+@dataclass(frozen=True)
+class FeedDocument:
+    """A generated feed, ready to be sent."""
+
+    media_type: str
+    body: bytes
+    gzipped: bytes
+    etag: str
+    last_modified: datetime
+
+
+def _make_document(
+    media_type: str, text: str, previous: Optional[FeedDocument] = None
+) -> FeedDocument:
+    """Encode and precompress a feed.
+
+    Last-Modified is the time the feed's bytes last changed, not a post
+    date: post dates are authored and day-granular, so a second post on
+    the same day or an edit of an older post would keep the date while
+    changing the body. A regenerated feed identical to the previous one
+    keeps its date, so If-Modified-Since agrees with the ETag.
+
+    Args:
+        media_type: Content-Type of the feed
+        text: The rendered feed
+        previous: The feed it replaces, if any
+    """
+    body = text.encode("utf-8")
+    etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+    if previous is not None and previous.etag == etag:
+        return previous
+
+    last_modified = datetime.now(timezone.utc).replace(microsecond=0)
+    if previous is not None and last_modified <= previous.last_modified:
+        # HTTP dates have a one-second resolution
+        last_modified = previous.last_modified + timedelta(seconds=1)
+    return FeedDocument(
+        media_type=media_type,
+        body=body,
+        # mtime=0 keeps the compressed bytes identical across regenerations
+        gzipped=gzip.compress(body, compresslevel=9, mtime=0),
+        etag=etag,
+        last_modified=last_modified,
+    )
+
+
+def _feed_entries(posts: Sequence[Mapping]) -> List[Dict]:
+    """Get the feed entries of posts, with their URL and UTC dates."""
+    site_url = get_site_url()
+    return [
+        {
+            "id": post["id"],
+            "url": f"{site_url}/blog/{post['id']}",
+            "title": str(post.get("title", "")),
+            "summary": str(post.get("excerpt") or post.get("description") or ""),
+            "author": str(post.get("author", "")),
+            "tags": [str(tag) for tag in post.get("tags") or []],
+            "published": _as_utc(parse_post_date(post.get("date", ""))),
+            "updated": _as_utc(post_last_modified(post)),
+        }
+        for post in posts[:FEED_SIZE]
+    ]
+
+
+def render_rss(entries: List[Dict], updated: datetime) -> str:
+    """Render an RSS 2.0 feed."""
+    site_url = get_site_url()
+    items = "".join(
+        f"<item><title>{escape(entry['title'])}</title>"
+        f"<link>{escape(entry['url'])}</link>"
+        f"<guid isPermaLink=\"true\">{escape(entry['url'])}</guid>"
+        f"<pubDate>{format_datetime(entry['published'], usegmt=True)}</pubDate>"
+        f"<description>{escape(entry['summary'])}</description>"
+        + "".join(f"<category>{escape(tag)}</category>" for tag in entry["tags"])
+        + "</item>"
+        for entry in entries
+    )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>\n'
+        '<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom"><channel>'
+        f"<title>{escape(FEED_TITLE)}</title>"
+        f"<link>{escape(site_url)}/blog</link>"
+        f"<description>{escape(FEED_DESCRIPTION)}</description>"
+        f'<atom:link href="{escape(site_url)}/blog/feed.xml" rel="self" type="application/rss+xml"/>'
+        f"<lastBuildDate>{format_datetime(updated, usegmt=True)}</lastBuildDate>"
+        f"{items}</channel></rss>\n"
+    )
+
+
+def render_atom(entries: List[Dict], updated: datetime) -> str:
+    """Render an Atom 1.0 feed."""
+    site_url = get_site_url()
+    items = "".join(
+        f"<entry><title>{escape(entry['title'])}</title>"
+        f'<link href="{escape(entry["url"])}"/>'
+        f"<id>{escape(entry['url'])}</id>"
+        f"<published>{entry['published'].isoformat()}</published>"
+        f"<updated>{entry['updated'].isoformat()}</updated>"
+        f"<author><name>{escape(entry['author'])}</name></author>"
+        f"<summary>{escape(entry['summary'])}</summary>"
+        + "".join(f'<category term="{escape(tag)}"/>' for tag in entry["tags"])
+        + "</entry>"
+        for entry in entries
+    )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>\n'
+        '<feed xmlns="http://www.w3.org/2005/Atom">'
+        f"<title>{escape(FEED_TITLE)}</title>"
+        f'<link href="{escape(site_url)}/blog"/>'
+        f'<link href="{escape(site_url)}/blog/atom.xml" rel="self"/>'
+        f"<id>{escape(site_url)}/blog</id>"
+        f"<updated>{updated.isoformat()}</updated>"
+        f"{items}</feed>\n"
+    )
+
+
+def render_json_feed(entries: List[Dict]) -> str:
+    """Render a JSON Feed 1.1 document."""
+    site_url = get_site_url()
+    return json.dumps(
+        {
+            "version": "https://jsonfeed.org/version/1.1",
+            "title": FEED_TITLE,
+            "description": FEED_DESCRIPTION,
+            "home_page_url": f"{site_url}/blog",
+            "feed_url": f"{site_url}/blog/feed.json",
+            "items": [
+                {
+                    "id": entry["url"],
+                    "url": entry["url"],
+                    "title": entry["title"],
+                    "summary": entry["summary"],
+                    "date_published": entry["published"].isoformat(),
+                    "date_modified": entry["updated"].isoformat(),
+                    "authors": [{"name": entry["author"]}],
+                    "tags": entry["tags"],
+                }
+                for entry in entries
+            ],
+        },
+        ensure_ascii=False,
+    )
+
+
+def build_blog_feeds(
+    posts: Sequence[Mapping], previous: Optional[Dict[str, FeedDocument]] = None
+) -> Dict[str, FeedDocument]:
+    """Generate every feed of the newest posts.
+
+    Args:
+        posts: Post records (without bodies), newest first
+        previous: The feeds being replaced, whose Last-Modified dates are
+            kept for feeds whose bytes did not change
+
+    Returns:
+        Feeds by name ("rss", "atom", "json")
+    """
+    previous = previous or {}
+    entries = _feed_entries(posts)
+    updated = max((entry["updated"] for entry in entries), default=_EPOCH)
+    return {
+        "rss": _make_document(
+            "application/rss+xml; charset=utf-8", render_rss(entries, updated), previous.get("rss")
+        ),
+        "atom": _make_document(
+            "application/atom+xml; charset=utf-8", render_atom(entries, updated), previous.get("atom")
+        ),
+        "json": _make_document(
+            "application/feed+json; charset=utf-8", render_json_feed(entries), previous.get("json")
+        ),
+    }
+
+
+# Feeds and the backend version they were generated from
+_feeds_version: Optional[int] = None
+_feeds: Dict[str, FeedDocument] = {}
+_feeds_lock = threading.Lock()
+
+
+def get_blog_feed(name: str) -> FeedDocument:
+    """Get a feed, regenerating the feeds only if the published posts changed.
+
+    Args:
+        name: "rss", "atom" or "json"
+
+    Returns:
+        The precomputed feed
+    """
+    global _feeds_version, _feeds
+
+    backend = get_blog_backend()
+    version = backend.version()
+    if version != _feeds_version:
+        with _feeds_lock:
+            if version != _feeds_version:
+                _feeds = build_blog_feeds(backend.post_records(FEED_SIZE), _feeds)
+                _feeds_version = version
+    return _feeds[name]
+
+
+def _is_not_modified(request: Request, feed: FeedDocument) -> bool:
+    """Check the conditional GET headers of a request against a feed."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # ETags take precedence over dates when both are sent
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or feed.etag in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return feed.last_modified <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def _feed_endpoint(name: str):
+    """Create the request handler of a feed."""
+
+    async def endpoint(request: Request) -> Response:
+        # Rebuilding a feed reads the backend and gzips it; keep that off the event loop
+        feed = await asyncio.to_thread(get_blog_feed, name)
+        headers = {
+            "ETag": feed.etag,
+            "Last-Modified": format_datetime(feed.last_modified, usegmt=True),
+            "Cache-Control": f"public, max-age={FEED_MAX_AGE}",
+            "Vary": "Accept-Encoding",
+        }
+        if _is_not_modified(request, feed):
+            return Response(status_code=304, headers=headers)
+
+        body = feed.body
+        if "gzip" in request.headers.get("accept-encoding", ""):
+            body = feed.gzipped
+            headers["Content-Encoding"] = "gzip"
+        return Response(body, headers=headers, media_type=feed.media_type)
+
+    return endpoint
+
+
+# Mounted in front of the Reflex backend through rx.App(api_transformer=...);
+# GET routes answer HEAD requests as well
+blog_feed_api = Starlette(
+    routes=[
+        Route("/blog/feed.xml", _feed_endpoint("rss")),
+        Route("/blog/atom.xml", _feed_endpoint("atom")),
+        Route("/blog/feed.json", _feed_endpoint("json")),
+    ]
+)
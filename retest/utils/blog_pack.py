@@ -0,0 +1,170 @@
+"""Prebuilt binary blog index that worker processes open with mmap.
+
+The pack file holds the metadata of every published post (of every content
+root) plus offsets into a single blob of post bodies:
+
+    header | metadata (JSON) | bodies (UTF-8)
+
+Build it with ``python -m retest.utils.blog_pack`` after adding or editing
+posts. Every worker maps the same file, so the bodies live once in the page
+cache and startup needs no markdown parsing. Files that changed since the
+pack was built are re-parsed from markdown by the blog index. Building the
+pack also highlights every fenced code block into the shared on-disk
+highlight cache, so no worker runs Pygments for published posts.
+"""
+
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from .blog import (
+    get_blog_content_roots,
+    get_blog_posts_directory,
+    get_blog_roots_signature,
+    load_blog_root_posts,
+)
+from .blog_render import render_markdown
+
+PACK_MAGIC = b"RTBLOGIX"
+PACK_VERSION = 4
+# magic, version, metadata length
+_HEADER = struct.Struct("<8sIQ")
+
+
+def get_blog_pack_path() -> Path:
+    """Get the blog pack file path (override with the BLOG_INDEX_PATH env var)."""
+    path = os.getenv("BLOG_INDEX_PATH")
+    if path:
+        return Path(path)
+    return get_blog_posts_directory().parent / "blog_index.bin"
+
+
+class BlogPack:
+    """Read-only view of a memory-mapped blog pack file."""
+
+    def __init__(self, path: Path):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, meta_length = _HEADER.unpack_from(self._mmap, 0)
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            self._mmap.close()
+            raise ValueError(f"Unsupported blog pack format in {path}")
+
+        meta_start = _HEADER.size
+        metadata = json.loads(self._mmap[meta_start:meta_start + meta_length])
+        self._body_start = meta_start + meta_length
+
+        self.files: Dict[str, Tuple[int, int]] = {
+            name: tuple(signature) for name, signature in metadata["files"].items()
+        }
+        self.posts: List[Dict] = []
+        # Post ID -> path of the markdown file it was built from
+        self.post_files: Dict[str, str] = {}
+        self._spans: Dict[str, Tuple[int, int]] = {}
+        for post in metadata["posts"]:
+            offset, length = post.pop("body_span")
+            self._spans[post["id"]] = (offset, length)
+            self.post_files[post["id"]] = post.pop("file")
+            self.posts.append(post)
+
+    def body(self, post_id: str) -> Optional[str]:
+        """Get the markdown body of a post straight from the mapped file.
+
+        Args:
+            post_id: The blog post ID
+
+        Returns:
+            The post body, or None if the post is not in the pack
+        """
+        span = self._spans.get(post_id)
+        if span is None:
+            return None
+        start = self._body_start + span[0]
+        return self._mmap[start:start + span[1]].decode("utf-8")
+
+
+def build_blog_pack(path: Optional[Path] = None) -> Path:
+    """Compile all published blog posts into a pack file.
+
+    Args:
+        path: Output file, defaults to ``get_blog_pack_path()``
+
+    Returns:
+        Path of the written pack file
+    """
+    path = path or get_blog_pack_path()
+    roots = get_blog_content_roots()
+    # Record the signature before parsing, so edits made meanwhile show up as stale
+    files = get_blog_roots_signature(roots)
+
+    records = []
+    bodies = []
+    offset = 0
+    for file_key, post in load_blog_root_posts(roots):
+        # Warms the on-disk highlight cache for the post's code blocks
+        render_markdown(post["content"])
+        body = post["content"].encode("utf-8")
+        record = {key: value for key, value in post.items() if key != "content"}
+        record["body_span"] = [offset, len(body)]
+        record["file"] = file_key
+        records.append(record)
+        bodies.append(body)
+        offset += len(body)
+
+    metadata = json.dumps({"files": files, "posts": records}, default=str).encode("utf-8")
+
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(PACK_MAGIC, PACK_VERSION, len(metadata)))
+        f.write(metadata)
+        for body in bodies:
+            f.write(body)
+    os.replace(tmp_path, path)
+    return path
+
+
+_blog_pack: Optional[BlogPack] = None
+# (path, mtime_ns) of a pack file that failed to load, so it is not retried on every read
+_blog_pack_failure: Optional[Tuple[Path, int]] = None
+
+
+def load_blog_pack() -> Optional[BlogPack]:
+    """Open the blog pack file, if one has been built.
+
+    Returns:
+        The memory-mapped BlogPack, or None if it is missing or unreadable
+    """
+    global _blog_pack, _blog_pack_failure
+
+    if _blog_pack is not None:
+        return _blog_pack
+
+    path = get_blog_pack_path()
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return None
+    if _blog_pack_failure == (path, mtime_ns):
+        return None
+
+    try:
+        _blog_pack = BlogPack(path)
+    except Exception as e:
+        print(f"Error loading blog pack {path}: {e}")
+        _blog_pack_failure = (path, mtime_ns)
+        return None
+    return _blog_pack
+
+
+def main() -> None:
+    """Build the blog pack from the command line."""
+    path = build_blog_pack()
+    pack = BlogPack(path)
+    print(f"Wrote {len(pack.posts)} posts to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""Compact, immutable records for the posts held by the shared blog index.
+
+Each indexed post used to be a dict of 14 fields (plus a summary dict and one
+dict per table of contents entry). The records below keep the same keys
+in ``__slots__`` instead, so a post costs a fixed-size object with no
+per-instance hash table, and repeated tag and author strings are interned.
+
+Records are read-only mappings, so index consumers keep using
+``post["id"]`` and ``post.get("tags")``. They are converted back to plain
+dicts with ``to_dict()`` where they leave the index for the app state.
+"""
+
+import sys
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, List
+
+
+class FrozenRecord(Mapping):
+    """Read-only mapping over the fields listed in a subclass's ``__slots__``."""
+
+    __slots__ = ()
+    # Values of fields missing from the mapping given to ``from_mapping``
+    _defaults: Dict[str, Any] = {}
+
+    def __init__(self, *values):
+        if len(values) != len(self.__slots__):
+            raise TypeError(f"{type(self).__name__} takes {len(self.__slots__)} values")
+        for name, value in zip(self.__slots__, values):
+            object.__setattr__(self, name, value)
+
+    @classmethod
+    def _convert(cls, name: str, value: Any) -> Any:
+        """Normalize a field value while building a record."""
+        return value
+
+    @classmethod
+    def from_mapping(cls, data: Mapping):
+        """Build a record from a dict (or another record), ignoring extra keys."""
+        return cls(*(
+            cls._convert(name, data.get(name, cls._defaults.get(name)))
+            for name in cls.__slots__
+        ))
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.__slots__:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__slots__)
+
+    def __len__(self) -> int:
+        return len(self.__slots__)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        # Slots are set through __init__, so records can cross process pools
+        return (type(self), tuple(getattr(self, name) for name in self.__slots__))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the record to plain dicts and lists (for the app state)."""
+        return {name: _to_plain(getattr(self, name)) for name in self.__slots__}
+
+
+def _to_plain(value: Any) -> Any:
+    """Convert nested records and tuples back to dicts and lists."""
+    if isinstance(value, FrozenRecord):
+        return value.to_dict()
+    if isinstance(value, tuple):
+        return [_to_plain(item) for item in value]
+    return value
+
+
+def _intern_string(value: Any) -> Any:
+    """Intern a string so equal values across posts share one object."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class BlogTocEntry(FrozenRecord):
+    """One heading of a post's table of contents."""
+
+    __slots__ = ("id", "title", "level")
+
+
+class BlogPostRecord(FrozenRecord):
+    """Frontmatter and derived fields of an indexed post (no body)."""
+
+    __slots__ = (
+        "id",
+        "title",
+        "excerpt",
+        "description",
+        "date",
+        "last_modified",
+        "author",
+        "tags",
+        "featured",
+        "published",
+        "publish_at",
+        "read_time",
+        "word_count",
+        "toc",
+    )
+    _defaults = {
+        "title": "Untitled",
+        "excerpt": "",
+        "description": "",
+        "date": "",
+        "last_modified": "",
+        "author": "Anonymous",
+        "tags": (),
+        "featured": False,
+        "published": True,
+        "publish_at": "",
+        "read_time": "1 min read",
+        "word_count": 0,
+        "toc": (),
+    }
+
+    @classmethod
+    def _convert(cls, name: str, value: Any) -> Any:
+        if name == "tags":
+            if isinstance(value, str):
+                value = [value]
+            return tuple(sys.intern(str(tag)) for tag in value or ())
+        if name == "toc":
+            return tuple(BlogTocEntry.from_mapping(entry) for entry in value or ())
+        if name == "author":
+            return _intern_string(value)
+        return value
+
+
+class BlogPostSummary(FrozenRecord):
+    """Fields of a post sent to the browser for listings and the sidebar.
+
+    Built from a BlogPostRecord, so it shares the record's values.
+    """
+
+    __slots__ = ("id", "title", "excerpt", "date", "tags", "read_time")
+
+
+def records_to_dicts(records: Iterable[FrozenRecord]) -> List[Dict[str, Any]]:
+    """Convert records leaving the index into a list of plain dicts."""
+    return [record.to_dict() for record in records]
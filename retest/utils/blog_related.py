@@ -0,0 +1,224 @@
+"""Related posts, precomputed from tag overlap and TF-IDF similarity."""
+
+import heapq
+import math
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+from .blog import (
+    BlogIndex,
+    BlogIndexChangeQueue,
+    add_blog_index_listener,
+    get_blog_index,
+    read_blog_post_body,
+)
+from .blog_record import BlogPostRecord
+from .blog_search import tokenize
+
+# Number of related posts kept per post
+RELATED_POSTS_COUNT = 5
+# Share of the score that comes from tag overlap (the rest is body similarity)
+RELATED_TAG_WEIGHT = 0.4
+# Only the highest weighted terms of each post are compared
+RELATED_TERMS_PER_POST = 25
+
+
+class BlogRelatedIndex:
+    """Top related posts of every post of the shared blog index.
+
+    Changes reported by the blog index are queued and applied by the next
+    ``sync``, so a lookup is a dictionary read once the lists have caught
+    up with the index. Changed posts get a fresh
+    list and are inserted into the lists of other posts they now beat;
+    lists that referenced a changed post are recomputed. Term weights use
+    the document frequencies of the moment a post was (re)indexed and are
+    refreshed for every post on a full rebuild.
+    """
+
+    def __init__(self):
+        self._document_frequency: Dict[str, int] = {}
+        self._doc_terms: Dict[str, Set[str]] = {}
+        self._vectors: Dict[str, Dict[str, float]] = {}
+        self._term_posts: Dict[str, Set[str]] = {}
+        self._tags: Dict[str, Set[str]] = {}
+        self._related: Dict[str, Tuple[Tuple[float, str], ...]] = {}
+        self._changes = BlogIndexChangeQueue()
+        # Blog index the lists reflect
+        self._index: Optional[BlogIndex] = None
+        # Serializes the recomputation
+        self._lock = threading.Lock()
+
+    def _read_terms(self, index: BlogIndex, post_id: str) -> Dict[str, int]:
+        """Count the terms of a post's title, excerpt and body."""
+        post = index.by_id[post_id]
+        tokens = tokenize(str(post.get("title", "")))
+        tokens += tokenize(str(post.get("excerpt", "")))
+        tokens += tokenize(read_blog_post_body(index, post_id) or "")
+        frequencies: Dict[str, int] = {}
+        for token in tokens:
+            frequencies[token] = frequencies.get(token, 0) + 1
+        return frequencies
+
+    def _set_vector(self, post_id: str, frequencies: Dict[str, int]) -> None:
+        """Store the pruned, normalized TF-IDF vector of a post."""
+        document_count = max(1, len(self._doc_terms))
+        weights = {
+            term: (1 + math.log(frequency))
+            * math.log(1 + document_count / self._document_frequency[term])
+            for term, frequency in frequencies.items()
+        }
+        top_terms = heapq.nlargest(RELATED_TERMS_PER_POST, weights.items(), key=lambda item: item[1])
+        norm = math.sqrt(sum(weight * weight for _, weight in top_terms)) or 1.0
+        self._vectors[post_id] = {term: weight / norm for term, weight in top_terms}
+        for term, _ in top_terms:
+            self._term_posts.setdefault(term, set()).add(post_id)
+
+    def _add_terms(self, post: BlogPostRecord, frequencies: Dict[str, int]) -> None:
+        """Count a post's terms into the document frequencies."""
+        self._doc_terms[post["id"]] = set(frequencies)
+        for term in frequencies:
+            self._document_frequency[term] = self._document_frequency.get(term, 0) + 1
+        self._tags[post["id"]] = set(post["tags"])
+
+    def _remove_post(self, post_id: str) -> None:
+        """Drop a post's terms, vector and related list."""
+        for term in self._doc_terms.pop(post_id, ()):
+            self._document_frequency[term] -= 1
+            if not self._document_frequency[term]:
+                del self._document_frequency[term]
+        for term in self._vectors.pop(post_id, {}):
+            posts = self._term_posts[term]
+            posts.discard(post_id)
+            if not posts:
+                del self._term_posts[term]
+        self._tags.pop(post_id, None)
+        self._related.pop(post_id, None)
+
+    def _scores(self, index: BlogIndex, post_id: str) -> Dict[str, float]:
+        """Score every post that shares a tag or a top term with a post."""
+        similarity: Dict[str, float] = {}
+        for term, weight in self._vectors[post_id].items():
+            for other_id in self._term_posts.get(term, ()):
+                similarity[other_id] = similarity.get(other_id, 0.0) + weight * self._vectors[other_id][term]
+
+        tags = self._tags[post_id]
+        candidates = set(similarity)
+        for tag in tags:
+            candidates.update(key[1] for key in index.tag_keys.get(tag, ()))
+        candidates.discard(post_id)
+
+        scores = {}
+        for other_id in candidates:
+            other_tags = self._tags.get(other_id)
+            if other_tags is None:
+                continue
+            union = len(tags | other_tags)
+            overlap = len(tags & other_tags) / union if union else 0.0
+            scores[other_id] = (
+                RELATED_TAG_WEIGHT * overlap
+                + (1 - RELATED_TAG_WEIGHT) * similarity.get(other_id, 0.0)
+            )
+        return scores
+
+    @staticmethod
+    def _top(scores: Dict[str, float]) -> Tuple[Tuple[float, str], ...]:
+        """Pick the best scored posts (ties broken by post ID)."""
+        best = heapq.nsmallest(
+            RELATED_POSTS_COUNT,
+            ((-score, other_id) for other_id, score in scores.items() if score > 0),
+        )
+        return tuple((-negative, other_id) for negative, other_id in best)
+
+    def sync(self, index: Optional[BlogIndex] = None) -> None:
+        """Apply the queued blog index changes.
+
+        The queue is applied to the index it was reported with, so changes
+        are never applied to an older snapshot. ``get_blog_index()`` is
+        only called before taking the lock, as it may run the listeners.
+
+        Args:
+            index: Blog index to reflect until the blog index reports a
+                change, defaults to the current shared index
+        """
+        if index is None:
+            index = get_blog_index()
+        with self._lock:
+            index, changed = self._changes.take(index)
+            if changed is None:
+                self._document_frequency = {}
+                self._doc_terms = {}
+                self._vectors = {}
+                self._term_posts = {}
+                self._tags = {}
+                self._related = {}
+                changed = set(index.by_id)
+            if not changed and index is self._index:
+                return
+
+            # Lists that pointed at a changed post have to be recomputed
+            stale = {
+                post_id
+                for post_id, related in self._related.items()
+                if any(other_id in changed for _, other_id in related)
+            }
+            for post_id in changed:
+                self._remove_post(post_id)
+
+            added = {}
+            for post_id in changed:
+                if post_id in index.by_id:
+                    added[post_id] = self._read_terms(index, post_id)
+                    self._add_terms(index.by_id[post_id], added[post_id])
+            # Weights are computed once every added post counts in the document frequencies
+            for post_id, frequencies in added.items():
+                self._set_vector(post_id, frequencies)
+
+            for post_id in added:
+                scores = self._scores(index, post_id)
+                self._related[post_id] = self._top(scores)
+                # Similarity is symmetric: offer the post to the lists of its neighbours
+                for other_id, score in scores.items():
+                    if other_id in added or other_id in stale:
+                        continue
+                    related = self._related.get(other_id, ())
+                    if len(related) < RELATED_POSTS_COUNT or score >= related[-1][0]:
+                        candidates = {related_id: related_score for related_score, related_id in related}
+                        candidates[post_id] = score
+                        self._related[other_id] = self._top(candidates)
+
+            for post_id in stale - changed:
+                if post_id in self._vectors:
+                    self._related[post_id] = self._top(self._scores(index, post_id))
+            self._index = index
+
+    def related_post_ids(self, post_id: str) -> List[str]:
+        """Get the IDs of the posts most related to a post, best first."""
+        return [other_id for _, other_id in self._related.get(post_id, ())]
+
+
+_blog_related_index = BlogRelatedIndex()
+add_blog_index_listener(_blog_related_index._changes.record)
+
+
+def warm_related_posts() -> None:
+    """Compute the related posts ahead of the first post page, which would otherwise pay for it."""
+    _blog_related_index.sync()
+
+
+def get_related_posts(post_id: str) -> List[Dict]:
+    """Get the summaries of the posts most related to a post.
+
+    Args:
+        post_id: The blog post ID
+
+    Returns:
+        Up to RELATED_POSTS_COUNT post summaries, most related first
+    """
+    index = get_blog_index()
+    # Only the posts changed since the last call are recomputed
+    if _blog_related_index._index is not index:
+        _blog_related_index.sync(index)
+    return [
+        index.summary_by_id[other_id].to_dict()
+        for other_id in _blog_related_index.related_post_ids(post_id)
+        if other_id in index.summary_by_id
+    ]
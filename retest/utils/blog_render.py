@@ -0,0 +1,88 @@
+"""Server-side rendering of blog post markdown to HTML."""
+
+import hashlib
+import os
+from typing import Dict
+from markdown_it import MarkdownIt
+from .blog import BlogBodyCache, heading_text, slugify_heading
+from .highlight import highlight_block
+from .images import get_image_manifest_hash, picture_html
+
+# Maximum number of characters of rendered HTML kept in memory
+BLOG_HTML_CACHE_SIZE = int(os.getenv("BLOG_HTML_CACHE_SIZE", str(16 * 1024 * 1024)))
+
+
+def _highlight_fence(code: str, language: str, attrs: str) -> str:
+    """Highlight a fenced code block (memoized by language and code hash)."""
+    return highlight_block(code, language)
+
+
+def _add_heading_ids(state) -> None:
+    """Give ATX headings the anchor ids listed in the post's table of contents."""
+    lines = state.src.split("\n")
+    used = {}
+    for token in state.tokens:
+        if token.type != "heading_open" or not token.map or not token.markup.startswith("#"):
+            continue
+        # Same source line and slug rules as the indexer's TOC extraction
+        heading = heading_text(lines[token.map[0]])
+        if heading is not None:
+            token.attrSet("id", slugify_heading(heading[1], used))
+
+
+# Rendered width of images in the post column, for picking a variant
+BLOG_IMAGE_SIZES = "(max-width: 800px) 100vw, 800px"
+
+
+def _render_image(renderer, tokens, idx, options, env) -> str:
+    """Render site images as responsive <picture> elements."""
+    token = tokens[idx]
+    src = token.attrGet("src") or ""
+    if not src.startswith("/") or src.startswith("//"):
+        return renderer.image(tokens, idx, options, env)
+    alt = renderer.renderInlineAsText(token.children or [], options, env)
+    return picture_html(src, alt, BLOG_IMAGE_SIZES)
+
+
+# CommonMark plus GitHub-style tables and strikethrough. Raw HTML is escaped
+# and markdown-it refuses javascript:/vbscript:/file: links, so the output
+# is safe to inject into the page. Fenced code is highlighted by Pygments,
+# headings get the anchor ids of the table of contents, and images on the
+# site use their responsive variants.
+_markdown = MarkdownIt(
+    "commonmark", {"html": False, "highlight": _highlight_fence}
+).enable(["table", "strikethrough"])
+_markdown.core.ruler.push("heading_ids", _add_heading_ids)
+_markdown.add_render_rule("image", _render_image)
+
+_html_cache = BlogBodyCache(BLOG_HTML_CACHE_SIZE)
+
+
+def content_hash(content: str) -> str:
+    """Get the cache key of a markdown document."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def render_markdown(content: str) -> str:
+    """Render markdown to sanitized HTML, cached by content hash.
+    
+    The cache key includes the image variants manifest, so rebuilding the
+    variants re-renders the <picture> markup of posts.
+    
+    Args:
+        content: Markdown source
+        
+    Returns:
+        HTML fragment
+    """
+    key = (content_hash(content), get_image_manifest_hash())
+    html = _html_cache.get(key)
+    if html is None:
+        html = _markdown.render(content)
+        _html_cache.put(key, html)
+    return html
+
+
+def get_blog_html_cache_stats() -> Dict[str, int]:
+    """Get the hit/miss counters of the rendered HTML cache."""
+    return _html_cache.stats()
@@ -0,0 +1,284 @@
+"""Full-text search over blog posts with BM25 ranking."""
+
+import heapq
+import html
+import math
+import re
+import threading
+from operator import itemgetter
+from typing import Dict, List, Optional, Set
+from .blog import (
+    BlogIndex,
+    BlogIndexChangeQueue,
+    add_blog_index_listener,
+    get_blog_index,
+    get_blog_post_by_id,
+    read_blog_post_body,
+)
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+# Title words count this many times as often as body words
+TITLE_WEIGHT = 3
+# Characters of context shown around the first match in a snippet
+SNIPPET_LENGTH = 180
+
+WORD_PATTERN = re.compile(r"\w+", re.UNICODE)
+STOP_WORDS = frozenset(
+    "a an and are as at be but by for from has have i if in into is it its "
+    "my no not of on or so that the their then there these this to was we "
+    "were what when which will with you your".split()
+)
+
+
+def stem(word: str) -> str:
+    """Reduce an English word to a crude stem (plural, -ed, -ing, final -e).
+
+    Args:
+        word: Lowercase word
+
+    Returns:
+        Stem shared by the common inflections of the word
+    """
+    if len(word) <= 3 or not word.isalpha():
+        return word
+
+    if word.endswith("sses"):
+        word = word[:-2]
+    elif word.endswith("ies"):
+        word = word[:-3] + "y"
+    elif word.endswith("s") and not word.endswith(("ss", "us")):
+        word = word[:-1]
+
+    for suffix in ("ing", "ed"):
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            word = word[:-len(suffix)]
+            # running -> run, but keep "all", "miss", "buzz"
+            if word[-1] == word[-2] and word[-1] not in "lsz":
+                word = word[:-1]
+            break
+
+    if word.endswith("e") and len(word) > 4:
+        word = word[:-1]
+    return word
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase, stemmed terms without stop words."""
+    return [
+        stem(word)
+        for word in WORD_PATTERN.findall(text.lower())
+        if word not in STOP_WORDS
+    ]
+
+
+def highlight_snippet(body: str, terms: Set[str]) -> str:
+    """Cut a snippet around the first matching word and mark every match.
+
+    Args:
+        body: Post body to cut the snippet from
+        terms: Stemmed query terms
+
+    Returns:
+        HTML-escaped snippet with matching words wrapped in <mark>
+    """
+    words = WORD_PATTERN.finditer(body)
+    first = next((word for word in words if stem(word.group().lower()) in terms), None)
+    start = max(0, first.start() - SNIPPET_LENGTH // 3) if first else 0
+    end = min(len(body), start + SNIPPET_LENGTH)
+
+    # Don't cut words in half at the edges of the snippet
+    if start > 0:
+        space = body.find(" ", start)
+        start = space + 1 if 0 <= space < end else start
+    if end < len(body):
+        space = body.rfind(" ", start, end)
+        end = space if space > start else end
+
+    # Only the rest of the window is scanned for further matches
+    matches = [first] if first else []
+    for word in words:
+        if word.end() > end:
+            break
+        if stem(word.group().lower()) in terms:
+            matches.append(word)
+
+    parts = ["…" if start > 0 else ""]
+    position = start
+    for match in matches:
+        if match.start() < start:
+            continue
+        if match.end() > end:
+            break
+        parts.append(html.escape(body[position:match.start()]))
+        parts.append(f"<mark>{html.escape(match.group())}</mark>")
+        position = match.end()
+    parts.append(html.escape(body[position:end]))
+    parts.append("…" if end < len(body) else "")
+    return " ".join("".join(parts).split())
+
+
+class BlogSearchIndex:
+    """Inverted index over the posts of the shared blog index.
+
+    Changes reported by the blog index are queued and applied before the
+    next query, so only added, edited or removed posts are re-tokenized.
+    Queries are scored under the same lock that guards applying changes,
+    so a concurrent ``sync`` never changes the postings mid-query.
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._doc_terms: Dict[str, Dict[str, int]] = {}
+        self._doc_lengths: Dict[str, int] = {}
+        self._total_length = 0
+        # Post ID -> BM25 length normalization, recomputed after every change
+        self._norms: Dict[str, float] = {}
+        self._changes = BlogIndexChangeQueue()
+        # Blog index the postings reflect
+        self._index: Optional[BlogIndex] = None
+        # Guards the postings while changes are applied and while a query is scored
+        self._lock = threading.Lock()
+
+    def _remove_document(self, post_id: str) -> None:
+        """Drop a post from the postings."""
+        terms = self._doc_terms.pop(post_id, None)
+        if terms is None:
+            return
+        for term in terms:
+            postings = self._postings[term]
+            del postings[post_id]
+            if not postings:
+                del self._postings[term]
+        self._total_length -= self._doc_lengths.pop(post_id)
+
+    def _add_document(self, index: BlogIndex, post_id: str) -> None:
+        """Tokenize a post and add it to the postings."""
+        post = index.by_id[post_id]
+        tokens = tokenize(str(post.get("title", ""))) * TITLE_WEIGHT
+        tokens += tokenize(" ".join(post["tags"]))
+        tokens += tokenize(str(post.get("excerpt", "")))
+        tokens += tokenize(read_blog_post_body(index, post_id) or "")
+
+        terms: Dict[str, int] = {}
+        for token in tokens:
+            terms[token] = terms.get(token, 0) + 1
+        for term, frequency in terms.items():
+            self._postings.setdefault(term, {})[post_id] = frequency
+        self._doc_terms[post_id] = terms
+        self._doc_lengths[post_id] = len(tokens)
+        self._total_length += len(tokens)
+
+    def _update_norms(self) -> None:
+        """Precompute the BM25 length normalization of every post."""
+        average_length = self._total_length / len(self._doc_lengths) if self._doc_lengths else 0
+        scale = BM25_K1 * BM25_B / (average_length or 1)
+        base = BM25_K1 * (1 - BM25_B)
+        self._norms = {post_id: base + scale * length for post_id, length in self._doc_lengths.items()}
+
+    def _apply_pending(self, index: BlogIndex) -> BlogIndex:
+        """Apply the queued changes (the lock must be held).
+
+        Args:
+            index: Blog index to reflect until the blog index reports a change
+
+        Returns:
+            The blog index the postings now reflect
+        """
+        index, post_ids = self._changes.take(index)
+        rebuild = post_ids is None
+        if rebuild:
+            self._postings = {}
+            self._doc_terms = {}
+            self._doc_lengths = {}
+            self._total_length = 0
+            post_ids = set(index.by_id)
+
+        for post_id in post_ids:
+            self._remove_document(post_id)
+            if post_id in index.by_id:
+                self._add_document(index, post_id)
+        if post_ids or rebuild:
+            self._update_norms()
+        self._index = index
+        return index
+
+    def sync(self) -> BlogIndex:
+        """Apply the queued blog index changes.
+
+        Returns:
+            The blog index the search index now reflects
+        """
+        # Called before taking the lock, as it may run the listeners
+        index = get_blog_index()
+        with self._lock:
+            return self._apply_pending(index)
+
+    def search(self, query: str, limit: int = 10, snippets: bool = True) -> List[Dict]:
+        """Find the posts that best match a query.
+
+        Args:
+            query: Free-text query
+            limit: Maximum number of results
+            snippets: Include a highlighted snippet of each result's body
+
+        Returns:
+            Post summaries, best match first, with "score" and "snippet" added
+        """
+        terms = set(tokenize(query))
+        if not terms:
+            return []
+
+        current = get_blog_index()
+        with self._lock:
+            index = self._apply_pending(current)
+            norms = self._norms
+            document_count = len(norms)
+            scores: Dict[str, float] = {}
+            get_score = scores.get
+
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (document_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                weight = idf * (BM25_K1 + 1)
+                for post_id, frequency in postings.items():
+                    scores[post_id] = get_score(post_id, 0.0) + weight * frequency / (frequency + norms[post_id])
+            best = heapq.nlargest(limit, scores.items(), key=itemgetter(1))
+
+        results = []
+        # The postings reflect ``index``, so every hit has a summary in it
+        for post_id, score in best:
+            result = index.summary_by_id[post_id].to_dict()
+            result["score"] = round(score, 4)
+            result["snippet"] = ""
+            if snippets:
+                # Bodies of hits go through the post body LRU cache
+                post = get_blog_post_by_id(post_id)
+                result["snippet"] = highlight_snippet(post["content"] if post else "", terms)
+            results.append(result)
+        return results
+
+
+_blog_search_index = BlogSearchIndex()
+add_blog_index_listener(_blog_search_index._changes.record)
+
+
+def warm_blog_search_index() -> None:
+    """Build the search index ahead of the first query, which would otherwise pay for it."""
+    _blog_search_index.sync()
+
+
+def search_blog_posts(query: str, limit: int = 10) -> List[Dict]:
+    """Search all published blog posts.
+
+    Args:
+        query: Free-text query
+        limit: Maximum number of results
+
+    Returns:
+        Post summaries with a BM25 "score" and an HTML "snippet", best match first
+    """
+    return _blog_search_index.search(query, limit)
@@ -0,0 +1,347 @@
+"""Sitemap with an entry for every blog post.
+
+Reflex's sitemap plugin only knows the app's pages and skips dynamic routes
+such as ``/blog/[post_id]``. ``BlogSitemapPlugin`` adds one link per post
+of the selected blog backend, with ``lastmod`` from the post's ``last_modified`` or
+``date``, and splits the sitemap into a sitemap index plus shards once it
+exceeds ``SITEMAP_MAX_URLS`` (only with ``REFLEX_DEPLOY_URL`` set, as a
+sitemap index needs absolute shard locations).
+
+The compiled frontend only holds the sitemap of the last compile, so the
+backend serves ``/sitemap.xml`` and its shards itself (``blog_sitemap_api``),
+rendered once per backend version. For the dev server, which serves
+``.web/public`` directly, the ``keep_blog_sitemap_fresh`` lifespan task
+rewrites the files there once the backend's version changed. Only one worker
+process rewrites them, and every file is replaced atomically, so crawlers
+never read a partial one.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+from xml.sax.saxutils import escape
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+from reflex.config import get_config
+from reflex.plugins.sitemap import SitemapPlugin, generate_links_for_sitemap, generate_xml
+from reflex.utils.prerequisites import get_web_dir
+from .blog import post_last_modified
+from .blog_backend import get_blog_backend
+
+# Most URLs a single sitemap file may list (sitemaps.org protocol limit)
+SITEMAP_MAX_URLS = 50_000
+SITEMAP_PATH = "public/sitemap.xml"
+SITEMAP_SHARD_PATH = "public/sitemap-{number}.xml"
+# Page links of the last compile, for rebuilding the sitemap at runtime
+PAGE_LINKS_PATH = "sitemap_pages.json"
+# Held by the worker process that rewrites the sitemap at runtime
+SITEMAP_LOCK_PATH = "sitemap.lock"
+# Seconds between checks for blog changes the sitemap has not caught up with
+SITEMAP_REFRESH_INTERVAL = 5.0
+# Seconds crawlers may cache a served sitemap file
+SITEMAP_MAX_AGE = 3600
+
+_FINGERPRINT_PREFIX = "<!-- links:"
+
+
+def blog_sitemap_links(posts: Sequence[Mapping], deploy_url: Optional[str]) -> List[Dict]:
+    """Get a sitemap link for every post.
+
+    Args:
+        posts: Post records (without bodies)
+        deploy_url: Public URL of the site, if configured
+
+    Returns:
+        Sitemap links ("loc" and, when the post is dated, "lastmod")
+    """
+    base_url = (deploy_url or "").rstrip("/")
+    links = []
+    for post in posts:
+        link = {"loc": f"{base_url}/blog/{post['id']}"}
+        last_modified = post_last_modified(post)
+        if last_modified != datetime.min:
+            link["lastmod"] = last_modified.date().isoformat()
+        links.append(link)
+    return links
+
+
+def _links_fingerprint(links: Sequence[Dict]) -> str:
+    """Hash the links that go into the sitemap."""
+    return hashlib.sha256(json.dumps(links, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def _sitemap_index_xml(locations: Sequence[str]) -> str:
+    """Render a sitemap index pointing at the shards."""
+    entries = "".join(
+        f"  <sitemap>\n    <loc>{escape(location)}</loc>\n  </sitemap>\n"
+        for location in locations
+    )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>\n'
+        '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+        f"{entries}</sitemapindex>\n"
+    )
+
+
+def render_sitemap_files(links: Sequence[Dict], deploy_url: Optional[str]) -> List[Tuple[str, str]]:
+    """Render the sitemap, sharded when there are too many links.
+
+    Args:
+        links: Every link of the site
+        deploy_url: Public URL of the site, for the shard locations
+
+    Returns:
+        (path relative to the web directory, content) of each file, the
+        main sitemap first; its second line is a fingerprint of the links
+
+    A sitemap index must list absolute shard locations, so without a deploy
+    URL every link goes into one (oversized) sitemap and a warning is printed.
+    """
+    fingerprint = f"{_FINGERPRINT_PREFIX} {_links_fingerprint(links)} -->"
+
+    def with_fingerprint(xml: str) -> str:
+        # Comments may not precede the XML declaration
+        declaration, _, rest = xml.partition("\n")
+        return f"{declaration}\n{fingerprint}\n{rest}"
+
+    if len(links) <= SITEMAP_MAX_URLS:
+        return [(SITEMAP_PATH, with_fingerprint(generate_xml(links)))]
+    if not deploy_url:
+        print(
+            f"Sitemap has {len(links)} links but is not split into shards "
+            "(REFLEX_DEPLOY_URL is not set); set it to split the sitemap."
+        )
+        return [(SITEMAP_PATH, with_fingerprint(generate_xml(links)))]
+
+    base_url = deploy_url.rstrip("/")
+    shards = []
+    for number, start in enumerate(range(0, len(links), SITEMAP_MAX_URLS), start=1):
+        path = SITEMAP_SHARD_PATH.format(number=number)
+        shards.append((path, generate_xml(links[start:start + SITEMAP_MAX_URLS])))
+    locations = [f"{base_url}/{Path(path).name}" for path, _ in shards]
+    return [(SITEMAP_PATH, with_fingerprint(_sitemap_index_xml(locations))), *shards]
+
+
+def _current_fingerprint(web_dir: Path) -> Optional[str]:
+    """Read the links fingerprint of the sitemap on disk."""
+    try:
+        with open(web_dir / SITEMAP_PATH, encoding="utf-8") as f:
+            f.readline()
+            line = f.readline()
+    except OSError:
+        return None
+    if not line.startswith(_FINGERPRINT_PREFIX):
+        return None
+    return line[len(_FINGERPRINT_PREFIX):].strip(" ->\n")
+
+
+def write_sitemap(page_links: Sequence[Dict], posts: Sequence[Mapping]) -> bool:
+    """Write the sitemap of the app pages and blog posts, if its links changed.
+
+    Args:
+        page_links: Links of the app's static pages
+        posts: Records of the published posts
+
+    Returns:
+        Whether any file was written
+    """
+    deploy_url = get_config().deploy_url
+    links = [*page_links, *blog_sitemap_links(posts, deploy_url)]
+    web_dir = get_web_dir()
+    if _current_fingerprint(web_dir) == _links_fingerprint(links):
+        return False
+
+    files = render_sitemap_files(links, deploy_url)
+    public_dir = (web_dir / SITEMAP_PATH).parent
+    public_dir.mkdir(parents=True, exist_ok=True)
+    # The main sitemap is replaced last, so it never points at a missing shard
+    # and its fingerprint only matches complete output
+    for path, content in reversed(files):
+        _write_file_atomic(web_dir / path, content)
+    # Shards left over from a bigger sitemap
+    written = {Path(path).name for path, _ in files}
+    for stale in public_dir.glob(SITEMAP_SHARD_PATH.format(number="*").split("/")[-1]):
+        if stale.name not in written:
+            stale.unlink(missing_ok=True)
+    return True
+
+
+def _write_file_atomic(path: Path, content: str) -> None:
+    """Write a file through a temporary file, so readers never see it half written."""
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(content, encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def _read_page_links() -> Optional[List[Dict]]:
+    """Read the page links saved by the last compile, if any."""
+    try:
+        return json.loads((get_web_dir() / PAGE_LINKS_PATH).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+# Backend version the sitemap was last refreshed for
+_sitemap_version: Optional[int] = None
+# Open lock file of this process, once it became the sitemap writer
+_sitemap_writer_lock = None
+
+
+def refresh_blog_sitemap() -> bool:
+    """Rewrite the sitemap if the published posts changed since the last refresh.
+
+    Returns:
+        Whether any file was written
+    """
+    global _sitemap_version
+
+    backend = get_blog_backend()
+    # Read before the posts, so changes made meanwhile are picked up next time
+    version = backend.version()
+    if version == _sitemap_version:
+        return False
+    page_links = _read_page_links()
+    if page_links is None:
+        # The app has not been compiled yet
+        return False
+    written = write_sitemap(page_links, backend.post_records())
+    _sitemap_version = version
+    return written
+
+
+def _become_sitemap_writer(web_dir: Path) -> bool:
+    """Claim the runtime sitemap writes for this process.
+
+    Returns:
+        False if another worker process already writes the sitemap
+    """
+    global _sitemap_writer_lock
+
+    if _sitemap_writer_lock is not None:
+        return True
+    try:
+        import fcntl
+    except ImportError:
+        # No advisory locks (Windows): every worker writes, each file atomically
+        return True
+
+    lock_file = open(web_dir / SITEMAP_LOCK_PATH, "a")
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return False
+    # Held until the process exits
+    _sitemap_writer_lock = lock_file
+    return True
+
+
+async def keep_blog_sitemap_fresh() -> None:
+    """Rewrite the sitemap after blog changes, from a single worker process.
+
+    Meant to run as an app lifespan task. The backend's version is checked
+    every ``SITEMAP_REFRESH_INTERVAL`` seconds; the links are rebuilt and
+    written here, never from a blog index listener (which would run under
+    the index lock).
+    """
+    web_dir = get_web_dir()
+    web_dir.mkdir(parents=True, exist_ok=True)
+    if not _become_sitemap_writer(web_dir):
+        return
+    while True:
+        try:
+            await asyncio.to_thread(refresh_blog_sitemap)
+        except Exception as e:
+            print(f"Error refreshing the sitemap: {e}")
+        await asyncio.sleep(SITEMAP_REFRESH_INTERVAL)
+
+
+# Served sitemap files by name and the backend version they were rendered from
+_served_version: Optional[int] = None
+_served_files: Dict[str, str] = {}
+_served_lock = threading.Lock()
+
+
+def get_sitemap_files() -> Dict[str, str]:
+    """Get the sitemap files, rendering them only if the published posts changed.
+
+    Returns:
+        Content of each file by name ("sitemap.xml", "sitemap-1.xml", ...)
+    """
+    global _served_version, _served_files
+
+    backend = get_blog_backend()
+    version = backend.version()
+    if version != _served_version:
+        with _served_lock:
+            if version != _served_version:
+                deploy_url = get_config().deploy_url
+                # Without a compile (a backend-only deploy) only the posts are listed
+                page_links = _read_page_links() or []
+                links = [*page_links, *blog_sitemap_links(backend.post_records(), deploy_url)]
+                _served_files = {
+                    Path(path).name: content
+                    for path, content in render_sitemap_files(links, deploy_url)
+                }
+                _served_version = version
+    return _served_files
+
+
+async def _sitemap_endpoint(request: Request) -> Response:
+    """Serve the main sitemap or one of its shards."""
+    # Rendering reads every post record; keep that off the event loop
+    files = await asyncio.to_thread(get_sitemap_files)
+    content = files.get(request.url.path.rsplit("/", 1)[-1])
+    if content is None:
+        return Response(status_code=404)
+    return Response(
+        content,
+        headers={"Cache-Control": f"public, max-age={SITEMAP_MAX_AGE}"},
+        media_type="application/xml",
+    )
+
+
+def _sitemap_task(unevaluated_pages, trailing_slash) -> None:
+    """Compile task writing the sitemap (replaces the plugin's own task)."""
+    page_links = generate_links_for_sitemap(unevaluated_pages, trailing_slash)
+    web_dir = get_web_dir()
+    web_dir.mkdir(parents=True, exist_ok=True)
+    (web_dir / PAGE_LINKS_PATH).write_text(json.dumps(page_links, default=str), encoding="utf-8")
+    try:
+        posts = get_blog_backend().post_records()
+    except FileNotFoundError as e:
+        # The SQLite database is imported separately; the lifespan task adds the posts
+        print(f"Sitemap written without blog posts: {e}")
+        posts = []
+    write_sitemap(page_links, posts)
+
+
+class BlogSitemapPlugin(SitemapPlugin):
+    """Sitemap plugin that also lists every blog post."""
+
+    def pre_compile(self, **context):
+        """Write the sitemap before compilation.
+
+        Args:
+            context: The context for the plugin.
+        """
+        unevaluated_pages = context.get("unevaluated_pages", [])
+        context["add_save_task"](_sitemap_task, unevaluated_pages, self.trailing_slash)
+
+
+# Mounted in front of the Reflex backend through rx.App(api_transformer=...),
+# ahead of the compiled frontend, whose sitemap files are only as new as the
+# last compile
+blog_sitemap_api = Starlette(
+    routes=[
+        Route("/sitemap.xml", _sitemap_endpoint),
+        Route("/sitemap-{number:int}.xml", _sitemap_endpoint),
+    ]
+)
@@ -0,0 +1,413 @@
+"""SQLite content store for the blog, with an FTS5 full-text index.
+
+``python -m retest.utils.blog_sqlite [DB_PATH]`` imports the markdown
+content roots into a database; re-running it only re-imports files that
+were added, changed or removed since the last import. Run the app with
+``BLOG_BACKEND=sqlite`` to serve the blog from the database.
+
+Schema:
+
+- ``posts``: one row per post: the JSON record and summary, plus the date
+  sort key, ``publish_at`` and the ``published`` flag as indexed columns
+- ``post_tags``: (tag, sort key, post id) of published posts, clustered by
+  tag for tag pages
+- ``posts_fts``: FTS5 table (title, tags, excerpt, body) sharing the rowid of
+  ``posts``; it also holds the only copy of each body
+- ``files``: path and mtime/size of every imported markdown file
+- ``meta``: the import version, bumped by every import that changed posts
+
+Posts with a future ``publish_at`` are imported but filtered out of every
+query until their time has come. Unpublished drafts are imported too, but
+only served by ``get_post``, as the markdown backend does.
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from .blog import (
+    BLOG_PAGE_SIZE,
+    BLOG_SUMMARY_FIELDS,
+    decode_blog_cursor,
+    encode_blog_cursor,
+    get_blog_content_roots,
+    get_blog_posts_directory,
+    get_blog_roots_signature,
+    parse_blog_post,
+    parse_publish_at,
+    post_sort_key,
+    resolve_blog_post_files,
+)
+from .blog_backend import BlogBackend
+from .blog_record import BlogPostRecord
+from .blog_related import RELATED_POSTS_COUNT
+from .blog_search import STOP_WORDS, WORD_PATTERN, TITLE_WEIGHT, highlight_snippet, tokenize
+
+# Stored in PRAGMA user_version; databases of another version are re-imported
+SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS files (name TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER);
+CREATE TABLE IF NOT EXISTS posts (
+    rowid INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    sort_ordinal INTEGER NOT NULL,
+    publish_at REAL,
+    published INTEGER NOT NULL,
+    record TEXT NOT NULL,
+    summary TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS posts_order ON posts (sort_ordinal, id);
+CREATE INDEX IF NOT EXISTS posts_scheduled ON posts (publish_at) WHERE publish_at IS NOT NULL;
+CREATE TABLE IF NOT EXISTS post_tags (
+    tag TEXT NOT NULL,
+    sort_ordinal INTEGER NOT NULL,
+    post_id TEXT NOT NULL,
+    PRIMARY KEY (tag, sort_ordinal, post_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS post_tags_post ON post_tags (post_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts USING fts5(
+    title, tags, excerpt, body, tokenize = 'porter unicode61'
+);
+"""
+
+# Tables dropped when the schema version changes (meta keeps the import version)
+_CONTENT_TABLES = ("files", "posts", "post_tags", "posts_fts")
+
+# Posts whose publish_at has passed (or that were never scheduled)
+_DUE = "(p.publish_at IS NULL OR p.publish_at <= :now)"
+# Posts shown in listings, search results and feeds
+_VISIBLE = f"(p.published AND {_DUE})"
+
+
+def get_blog_sqlite_path() -> Path:
+    """Get the blog database path (override with the BLOG_SQLITE_PATH env var)."""
+    path = os.getenv("BLOG_SQLITE_PATH")
+    if path:
+        return Path(path)
+    return get_blog_posts_directory().parent / "blog.sqlite3"
+
+
+def _delete_post(db: sqlite3.Connection, post_id: str) -> None:
+    """Remove a post from every table."""
+    row = db.execute("SELECT rowid FROM posts WHERE id = ?", (post_id,)).fetchone()
+    if row is None:
+        return
+    db.execute("DELETE FROM posts_fts WHERE rowid = ?", row)
+    db.execute("DELETE FROM post_tags WHERE post_id = ?", (post_id,))
+    db.execute("DELETE FROM posts WHERE rowid = ?", row)
+
+
+def _insert_post(db: sqlite3.Connection, post: Dict) -> None:
+    """Insert a parsed post (with "content") into every table."""
+    # Same normalization (tag tuples, TOC entries) as the in-memory index
+    record = BlogPostRecord.from_mapping(post).to_dict()
+    summary = {key: record[key] for key in BLOG_SUMMARY_FIELDS}
+    sort_ordinal = post_sort_key(record)[0]
+    tags = list(dict.fromkeys(record["tags"]))
+    published = bool(record["published"])
+
+    cursor = db.execute(
+        "INSERT INTO posts (id, sort_ordinal, publish_at, published, record, summary) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        (
+            record["id"],
+            sort_ordinal,
+            parse_publish_at(record["publish_at"]),
+            published,
+            json.dumps(record, default=str),
+            json.dumps(summary, default=str),
+        ),
+    )
+    if published:
+        db.executemany(
+            "INSERT OR IGNORE INTO post_tags (tag, sort_ordinal, post_id) VALUES (?, ?, ?)",
+            [(tag, sort_ordinal, record["id"]) for tag in tags],
+        )
+    db.execute(
+        "INSERT INTO posts_fts (rowid, title, tags, excerpt, body) VALUES (?, ?, ?, ?, ?)",
+        (
+            cursor.lastrowid,
+            str(record["title"]),
+            " ".join(tags),
+            str(record["excerpt"]),
+            post["content"],
+        ),
+    )
+
+
+def import_blog_posts(
+    db_path: Optional[Path] = None, roots: Optional[List[Path]] = None
+) -> Dict[str, int]:
+    """Import new, changed and removed markdown files into the blog database.
+
+    Args:
+        db_path: Database file, defaults to ``get_blog_sqlite_path()``
+        roots: Content roots, defaults to ``get_blog_content_roots()``
+
+    Returns:
+        Number of "imported", "unchanged" and "removed" files
+    """
+    db_path = db_path or get_blog_sqlite_path()
+    roots = roots or get_blog_content_roots()
+    files = get_blog_roots_signature(roots)
+
+    db = sqlite3.connect(db_path)
+    try:
+        # Readers keep working on the previous snapshot while an import runs
+        db.execute("PRAGMA journal_mode = WAL")
+        if db.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            with db:
+                for table in _CONTENT_TABLES:
+                    db.execute(f"DROP TABLE IF EXISTS {table}")
+            db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        db.executescript(_SCHEMA)
+        imported_files = {
+            name: (mtime_ns, size)
+            for name, mtime_ns, size in db.execute("SELECT name, mtime_ns, size FROM files")
+        }
+        changed = {
+            name
+            for name in imported_files.keys() | files.keys()
+            if imported_files.get(name) != files.get(name)
+        }
+        counts = {"imported": 0, "unchanged": len(files.keys() - changed), "removed": 0}
+
+        with db:
+            for name in changed:
+                if name in files:
+                    db.execute(
+                        "INSERT OR REPLACE INTO files (name, mtime_ns, size) VALUES (?, ?, ?)",
+                        (name, *files[name]),
+                    )
+                    counts["imported"] += 1
+                else:
+                    db.execute("DELETE FROM files WHERE name = ?", (name,))
+                    counts["removed"] += 1
+
+            # A post ID may move to another root when its file in one root is removed
+            for post_id in sorted({Path(name).stem for name in changed}):
+                _delete_post(db, post_id)
+                candidates = [str(root / f"{post_id}.md") for root in roots]
+                file_key = resolve_blog_post_files(
+                    [key for key in candidates if key in files], roots
+                ).get(post_id)
+                if file_key is None:
+                    continue
+                post = parse_blog_post(Path(file_key))
+                if post is None:
+                    # Retried by the next import
+                    db.execute("DELETE FROM files WHERE name = ?", (file_key,))
+                else:
+                    _insert_post(db, post)
+
+            if changed:
+                db.execute(
+                    "INSERT INTO meta (key, value) VALUES ('version', 1) "
+                    "ON CONFLICT (key) DO UPDATE SET value = value + 1"
+                )
+        if changed:
+            db.execute("INSERT INTO posts_fts (posts_fts) VALUES ('optimize')")
+            db.commit()
+    finally:
+        db.close()
+    return counts
+
+
+def _fts_query(query: str) -> str:
+    """Turn free text into an FTS5 query matching any of its words."""
+    words = dict.fromkeys(
+        word for word in WORD_PATTERN.findall(query.lower()) if word not in STOP_WORDS
+    )
+    return " OR ".join(f'"{word}"' for word in words)
+
+
+class SqliteBlogBackend(BlogBackend):
+    """Backend reading the database written by ``import_blog_posts``."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path or get_blog_sqlite_path()
+        # sqlite3 connections must not be shared between threads
+        self._local = threading.local()
+
+    def _db(self) -> sqlite3.Connection:
+        """Get this thread's read-only connection."""
+        db = getattr(self._local, "db", None)
+        if db is None:
+            if not self.path.exists():
+                raise FileNotFoundError(
+                    f"Blog database {self.path} not found; run python -m retest.utils.blog_sqlite"
+                )
+            db = sqlite3.connect(f"{self.path.resolve().as_uri()}?mode=ro", uri=True)
+            self._local.db = db
+        return db
+
+    def _summaries(self, sql: str, **params) -> List[Dict]:
+        """Run a query whose first column is a JSON summary (or record)."""
+        rows = self._db().execute(sql, {"now": time.time(), **params})
+        return [json.loads(row[0]) for row in rows]
+
+    def version(self) -> int:
+        db = self._db()
+        row = db.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        # Scheduled posts going live change the listing without an import
+        due = db.execute(
+            "SELECT count(*) FROM posts WHERE publish_at IS NOT NULL AND publish_at <= ?",
+            (time.time(),),
+        ).fetchone()[0]
+        return ((row[0] if row else 0) << 32) + due
+
+    def get_post(self, post_id: str) -> Optional[Dict]:
+        row = self._db().execute(
+            f"SELECT p.record, f.body FROM posts p JOIN posts_fts f ON f.rowid = p.rowid "
+            f"WHERE p.id = :post_id AND {_DUE}",
+            {"post_id": post_id, "now": time.time()},
+        ).fetchone()
+        if row is None:
+            return None
+        return {**json.loads(row[0]), "content": row[1]}
+
+    def recent_posts(self, limit: int) -> List[Dict]:
+        return self._summaries(
+            f"SELECT p.summary FROM posts p WHERE {_VISIBLE} "
+            "ORDER BY p.sort_ordinal, p.id LIMIT :limit",
+            limit=limit,
+        )
+
+    def post_records(self, limit: Optional[int] = None) -> List[Dict]:
+        # A negative LIMIT means no limit
+        return self._summaries(
+            f"SELECT p.record FROM posts p WHERE {_VISIBLE} "
+            "ORDER BY p.sort_ordinal, p.id LIMIT :limit",
+            limit=-1 if limit is None else limit,
+        )
+
+    def get_page(
+        self, cursor: str = "", tag: str = "", limit: int = BLOG_PAGE_SIZE
+    ) -> Tuple[List[Dict], str]:
+        after = (-sys.maxsize, "")
+        if cursor:
+            try:
+                after = decode_blog_cursor(cursor)
+            except ValueError:
+                print(f"Invalid blog cursor: {cursor}")
+
+        params = {"ordinal": after[0], "post_id": after[1], "limit": limit + 1}
+        if tag:
+            sql = (
+                f"SELECT p.summary, p.sort_ordinal, p.id FROM post_tags t JOIN posts p ON p.id = t.post_id "
+                f"WHERE t.tag = :tag AND (t.sort_ordinal, t.post_id) > (:ordinal, :post_id) AND {_VISIBLE} "
+                "ORDER BY t.sort_ordinal, t.post_id LIMIT :limit"
+            )
+            params["tag"] = tag
+        else:
+            sql = (
+                f"SELECT p.summary, p.sort_ordinal, p.id FROM posts p "
+                f"WHERE (p.sort_ordinal, p.id) > (:ordinal, :post_id) AND {_VISIBLE} "
+                "ORDER BY p.sort_ordinal, p.id LIMIT :limit"
+            )
+        rows = self._db().execute(sql, {"now": time.time(), **params}).fetchall()
+
+        # One extra row tells whether there is a next page
+        next_cursor = ""
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_blog_cursor((rows[-1][1], rows[-1][2]))
+        return [json.loads(row[0]) for row in rows], next_cursor
+
+    def posts_by_tag(self, tag: str) -> List[Dict]:
+        return self._summaries(
+            f"SELECT p.summary FROM post_tags t JOIN posts p ON p.id = t.post_id "
+            f"WHERE t.tag = :tag AND {_VISIBLE} ORDER BY t.sort_ordinal, t.post_id",
+            tag=tag,
+        )
+
+    def posts_between(self, start: date, end: date) -> List[Dict]:
+        return self._summaries(
+            f"SELECT p.summary FROM posts p "
+            f"WHERE p.sort_ordinal BETWEEN :low AND :high AND {_VISIBLE} "
+            "ORDER BY p.sort_ordinal, p.id",
+            low=-end.toordinal(),
+            high=-start.toordinal(),
+        )
+
+    def tag_counts(self) -> Dict[str, int]:
+        rows = self._db().execute(
+            f"SELECT t.tag, count(*) FROM post_tags t JOIN posts p ON p.id = t.post_id "
+            f"WHERE {_VISIBLE} GROUP BY t.tag ORDER BY t.tag",
+            {"now": time.time()},
+        )
+        return dict(rows.fetchall())
+
+    def adjacent_posts(self, post_id: str) -> Tuple[Optional[Dict], Optional[Dict]]:
+        row = self._db().execute(
+            f"SELECT p.sort_ordinal FROM posts p WHERE p.id = :post_id AND {_VISIBLE}",
+            {"post_id": post_id, "now": time.time()},
+        ).fetchone()
+        if row is None:
+            return None, None
+
+        params = {"ordinal": row[0], "post_id": post_id}
+        newer = self._summaries(
+            f"SELECT p.summary FROM posts p WHERE (p.sort_ordinal, p.id) < (:ordinal, :post_id) "
+            f"AND {_VISIBLE} ORDER BY p.sort_ordinal DESC, p.id DESC LIMIT 1",
+            **params,
+        )
+        older = self._summaries(
+            f"SELECT p.summary FROM posts p WHERE (p.sort_ordinal, p.id) > (:ordinal, :post_id) "
+            f"AND {_VISIBLE} ORDER BY p.sort_ordinal, p.id LIMIT 1",
+            **params,
+        )
+        return (newer[0] if newer else None, older[0] if older else None)
+
+    def related_posts(self, post_id: str) -> List[Dict]:
+        # Posts sharing the most tags, newest first among equals
+        return self._summaries(
+            f"SELECT p.summary FROM post_tags t "
+            f"JOIN post_tags o ON o.tag = t.tag AND o.post_id != t.post_id "
+            f"JOIN posts p ON p.id = o.post_id "
+            f"WHERE t.post_id = :post_id AND {_VISIBLE} "
+            "GROUP BY p.id ORDER BY count(*) DESC, p.sort_ordinal, p.id LIMIT :limit",
+            post_id=post_id,
+            limit=RELATED_POSTS_COUNT,
+        )
+
+    def search(self, query: str, limit: int = 10) -> List[Dict]:
+        match = _fts_query(query)
+        if not match:
+            return []
+        rows = self._db().execute(
+            f"SELECT p.summary, bm25(posts_fts, {float(TITLE_WEIGHT)}, 1.0, 1.0, 1.0) AS rank, f.body "
+            f"FROM posts_fts f JOIN posts p ON p.rowid = f.rowid "
+            f"WHERE posts_fts MATCH :match AND {_VISIBLE} ORDER BY rank LIMIT :limit",
+            {"match": match, "limit": limit, "now": time.time()},
+        )
+        terms = set(tokenize(query))
+        results = []
+        for summary, rank, body in rows:
+            result = json.loads(summary)
+            # FTS5 ranks better matches lower
+            result["score"] = round(-rank, 4)
+            result["snippet"] = highlight_snippet(body, terms)
+            results.append(result)
+        return results
+
+
+def main() -> None:
+    """Import the blog into the database from the command line."""
+    db_path = Path(sys.argv[1]) if len(sys.argv) > 1 else get_blog_sqlite_path()
+    counts = import_blog_posts(db_path)
+    print(
+        f"Imported blog into {db_path}: {counts['imported']} imported, "
+        f"{counts['unchanged']} unchanged, {counts['removed']} removed"
+    )
+
+
+if __name__ == "__main__":
+    main()
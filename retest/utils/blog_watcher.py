@@ -0,0 +1,98 @@
+"""Filesystem watcher that keeps the shared blog index up to date."""
+
+import asyncio
+from pathlib import Path
+from .blog import (
+    get_blog_content_roots,
+    get_blog_index,
+    set_blog_index_watched,
+    update_blog_index,
+)
+from .blog_related import warm_related_posts
+from .blog_search import warm_blog_search_index
+
+# Seconds between directory scans when inotify is not available
+POLL_INTERVAL = 2.0
+
+
+def _is_blog_post(change, path: str) -> bool:
+    """Only report changes to markdown files."""
+    return path.endswith(".md")
+
+
+async def _watch_with_inotify(root: Path) -> None:
+    """Re-index the markdown files of a root reported by watchfiles (inotify on Linux)."""
+    from watchfiles import awatch
+
+    set_blog_index_watched(True, [root])
+    try:
+        async for changes in awatch(
+            root, watch_filter=_is_blog_post, recursive=False
+        ):
+            # The index keys files by their path under the configured root
+            file_paths = {root / Path(path).name for _, path in changes}
+            await asyncio.to_thread(update_blog_index, file_paths)
+    finally:
+        set_blog_index_watched(False, [root])
+
+
+async def _watch_root(root: Path) -> None:
+    """Watch one content root until it cannot be watched any more."""
+    try:
+        await _watch_with_inotify(root)
+    except Exception as e:
+        print(f"Error watching blog directory {root}: {e}")
+
+
+async def _watch_with_polling() -> None:
+    """Re-index changed markdown files by comparing mtimes and sizes.
+
+    Only roots without a working watcher are due every POLL_INTERVAL; watched
+    roots get the index's slower safety-net scan.
+    """
+    while True:
+        await asyncio.sleep(POLL_INTERVAL)
+        try:
+            await asyncio.to_thread(get_blog_index)
+        except Exception as e:
+            print(f"Error polling blog posts: {e}")
+
+
+async def _warm_blog_indexes() -> None:
+    """Build the search and related-posts indexes in the background at startup.
+
+    Both are built on first use otherwise, which takes seconds for large
+    blogs inside the first request's event handler.
+    """
+    for warm in (warm_blog_search_index, warm_related_posts):
+        try:
+            await asyncio.to_thread(warm)
+        except Exception as e:
+            print(f"Error warming blog index ({warm.__name__}): {e}")
+
+
+async def watch_blog_posts() -> None:
+    """Keep the blog index in sync with the content roots.
+
+    Meant to run as an app lifespan task. Every root is watched on its own,
+    so a change in one root only re-parses the changed files of that root.
+    Changed files are re-parsed one by one through ``update_blog_index``;
+    roots that cannot be watched (or all of them, if watchfiles is
+    missing) are polled instead. The search and related-posts indexes are
+    built meanwhile, so the first queries do not have to.
+    """
+    await asyncio.to_thread(get_blog_index, True)
+    roots = [root for root in get_blog_content_roots() if root.is_dir()]
+    try:
+        import watchfiles  # noqa: F401
+    except ImportError:
+        print(
+            "watchfiles is not installed; polling the blog posts every "
+            f"{POLL_INTERVAL:g}s instead of watching them."
+        )
+        roots = []
+    await asyncio.gather(
+        _warm_blog_indexes(),
+        _watch_with_polling(),
+        *(_watch_root(root) for root in roots),
+    )
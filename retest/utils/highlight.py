@@ -0,0 +1,153 @@
+"""Server-side syntax highlighting of code with Pygments.
+
+Highlighted HTML is memoized by (language, code hash) in memory and in an
+on-disk cache directory, so every worker process and every restart reuses
+the work done once at build/index time.
+"""
+
+import hashlib
+import html
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+from pygments import highlight
+from pygments.formatters import HtmlFormatter
+from pygments.lexers import get_lexer_by_name
+from pygments.util import ClassNotFound
+
+# CSS class of highlighted blocks and the Pygments styles for each theme
+HIGHLIGHT_CLASS = "highlight"
+LIGHT_STYLE = "friendly"
+DARK_STYLE = "github-dark"
+
+
+def get_highlight_cache_directory() -> Path:
+    """Get the on-disk highlight cache (override with HIGHLIGHT_CACHE_DIR)."""
+    path = os.getenv("HIGHLIGHT_CACHE_DIR")
+    if path:
+        return Path(path)
+    return Path(__file__).parent.parent.parent / ".cache" / "highlight"
+
+
+@lru_cache(maxsize=None)
+def _get_lexer(language: str):
+    """Get the Pygments lexer for a language name, None if unknown."""
+    try:
+        return get_lexer_by_name(language, stripnl=False, ensurenl=False)
+    except ClassNotFound:
+        return None
+
+
+_formatter = HtmlFormatter(nowrap=True)
+
+
+def _normalize_language(language: Optional[str]) -> str:
+    """Lowercase a language name, dropping names unsafe for file names and markup."""
+    language = (language or "").strip().lower()
+    if not language.replace("-", "").replace("+", "").replace("_", "").isalnum():
+        return ""
+    return language
+
+
+@lru_cache(maxsize=4096)
+def _highlight_by_hash(language: str, code_hash: str, code: str) -> str:
+    """Highlight code through the on-disk cache (memoized per process)."""
+    cache_file = get_highlight_cache_directory() / f"{language}-{code_hash}.html"
+    try:
+        return cache_file.read_text(encoding="utf-8")
+    except OSError:
+        pass
+
+    highlighted = highlight(code, _get_lexer(language), _formatter)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a private temp file first, so other workers never read a partial file
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        tmp_file.write_text(highlighted, encoding="utf-8")
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        print(f"Error writing highlight cache {cache_file}: {e}")
+    return highlighted
+
+
+def highlight_code(code: str, language: Optional[str] = None) -> str:
+    """Highlight code as HTML token spans (without the <pre> wrapper).
+
+    Args:
+        code: Source code
+        language: Pygments language name or alias ("python", "js", ...)
+
+    Returns:
+        HTML-escaped code with Pygments token classes, plain escaped code
+        if the language is unknown
+    """
+    language = _normalize_language(language)
+    if not language or _get_lexer(language) is None:
+        return html.escape(code)
+    code_hash = hashlib.sha256(code.encode("utf-8")).hexdigest()
+    return _highlight_by_hash(language, code_hash, code)
+
+
+def number_lines(highlighted: str) -> str:
+    """Prefix every line of highlighted code with its line number.
+
+    Pygments closes its token spans at the end of each line, so the lines
+    can be numbered after highlighting (and after the cache lookup).
+
+    Args:
+        highlighted: Output of ``highlight_code``
+
+    Returns:
+        The same markup with a non-selectable number span on each line
+    """
+    lines = highlighted.split("\n")
+    if lines and not lines[-1]:
+        lines.pop()
+    width = len(str(len(lines)))
+    return "".join(
+        f'<span class="linenos">{number:>{width}}</span>{line}\n'
+        for number, line in enumerate(lines, start=1)
+    )
+
+
+def highlight_block(
+    code: str,
+    language: Optional[str] = None,
+    line_numbers: bool = False,
+) -> str:
+    """Highlight code wrapped in a <pre><code> block.
+
+    Args:
+        code: Source code
+        language: Pygments language name or alias
+        line_numbers: Number the lines of the block
+
+    Returns:
+        HTML block with the HIGHLIGHT_CLASS class
+    """
+    language = _normalize_language(language)
+    language_class = f' class="language-{language}"' if language else ""
+    highlighted = highlight_code(code, language)
+    if line_numbers:
+        highlighted = number_lines(highlighted)
+    return f'<pre class="{HIGHLIGHT_CLASS}"><code{language_class}>{highlighted}</code></pre>'
+
+
+@lru_cache(maxsize=None)
+def get_highlight_css() -> str:
+    """Get the token colors for light and dark mode."""
+    light = HtmlFormatter(style=LIGHT_STYLE).get_style_defs(f".{HIGHLIGHT_CLASS}")
+    dark = HtmlFormatter(style=DARK_STYLE).get_style_defs(f".dark .{HIGHLIGHT_CLASS}")
+    # Keep the token rules only: the themes' backgrounds and the unscoped
+    # pre/line number rules would override the site's code block styles
+    rules = [
+        line
+        for line in f"{light}\n{dark}".splitlines()
+        if line.startswith((f".{HIGHLIGHT_CLASS} ", f".dark .{HIGHLIGHT_CLASS} "))
+        and "{ background" not in line
+    ]
+    rules.append(
+        f".{HIGHLIGHT_CLASS} .linenos {{ opacity: 0.5; margin-right: 1em; user-select: none }}"
+    )
+    return "\n".join(rules)
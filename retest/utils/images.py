@@ -0,0 +1,240 @@
+"""Responsive image variants for assets and blog post images.
+
+``python -m retest.utils.images`` resizes every image in ``assets/`` to a
+set of widths in WebP (and AVIF, when Pillow supports it), with
+content-hashed file names under ``assets/_img/``, plus a tiny inline blur
+placeholder. A manifest maps each image URL to its variants; images whose
+bytes did not change since the last build are skipped.
+
+Pages and the markdown renderer only read the manifest, and fall back to
+the original image when it has not been built (or Pillow is not installed).
+"""
+
+import base64
+import hashlib
+import html
+import io
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+try:
+    from PIL import Image, features
+except ImportError:  # Pillow is optional; without it images are served as-is
+    Image = None
+    features = None
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp")
+# Widths of the generated variants (never larger than the original)
+IMAGE_WIDTHS = (160, 320, 640, 960, 1280, 1920)
+IMAGE_QUALITY = {"webp": 80, "avif": 60}
+# Width of the inline blur placeholder
+PLACEHOLDER_WIDTH = 16
+VARIANTS_DIRECTORY = "_img"
+MANIFEST_NAME = "manifest.json"
+
+
+def get_assets_directory() -> Path:
+    """Get the app's assets directory (served at the site root)."""
+    return Path(__file__).parent.parent.parent / "assets"
+
+
+def _variant_formats() -> List[str]:
+    """Get the output formats Pillow can encode, best compression first."""
+    return [name for name in ("avif", "webp") if features.check(name)]
+
+
+def _placeholder(image) -> str:
+    """Encode a tiny version of an image as a data URI."""
+    height = max(1, round(image.height * PLACEHOLDER_WIDTH / image.width))
+    small = image.convert("RGB").resize((PLACEHOLDER_WIDTH, height))
+    buffer = io.BytesIO()
+    small.save(buffer, "JPEG", quality=40)
+    return "data:image/jpeg;base64," + base64.b64encode(buffer.getvalue()).decode("ascii")
+
+
+def _build_variants(source: Path, digest: str, output_dir: Path) -> Dict:
+    """Write the resized variants of one image.
+
+    Returns:
+        Manifest entry with the size, placeholder and srcset of each format
+    """
+    with Image.open(source) as image:
+        image.load()
+    if image.mode not in ("RGB", "RGBA"):
+        # Keep the alpha of LA/PA images and palette images with a transparent color
+        has_alpha = "A" in image.getbands() or "transparency" in image.info
+        image = image.convert("RGBA" if has_alpha else "RGB")
+
+    widths = [width for width in IMAGE_WIDTHS if width < image.width] + [image.width]
+    sources = {}
+    for image_format in _variant_formats():
+        srcset = []
+        for width in widths:
+            name = f"{source.stem}-{digest[:12]}-{width}.{image_format}"
+            path = output_dir / name
+            if not path.exists():
+                height = max(1, round(image.height * width / image.width))
+                resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+                resized.save(path, image_format.upper(), quality=IMAGE_QUALITY[image_format])
+            srcset.append(f"/{VARIANTS_DIRECTORY}/{name} {width}w")
+        sources[f"image/{image_format}"] = ", ".join(srcset)
+
+    return {
+        "hash": digest,
+        "width": image.width,
+        "height": image.height,
+        "placeholder": _placeholder(image),
+        "sources": sources,
+    }
+
+
+def build_image_variants(assets_dir: Optional[Path] = None) -> Tuple[int, int]:
+    """Generate the responsive variants of every image in the assets directory.
+
+    Args:
+        assets_dir: Directory to scan, defaults to ``get_assets_directory()``
+
+    Returns:
+        Number of (processed, unchanged) images
+    """
+    if Image is None:
+        print("Pillow is not installed (pip install pillow); images are served unchanged")
+        return 0, 0
+
+    assets_dir = assets_dir or get_assets_directory()
+    output_dir = assets_dir / VARIANTS_DIRECTORY
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = output_dir / MANIFEST_NAME
+    try:
+        previous = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        previous = {}
+
+    manifest = {}
+    processed = unchanged = 0
+    for source in sorted(assets_dir.rglob("*")):
+        if source.suffix.lower() not in IMAGE_EXTENSIONS or output_dir in source.parents:
+            continue
+        url = "/" + source.relative_to(assets_dir).as_posix()
+        digest = hashlib.sha256(source.read_bytes()).hexdigest()
+
+        entry = previous.get(url)
+        if entry and entry["hash"] == digest and entry["sources"].keys() == set(
+            f"image/{name}" for name in _variant_formats()
+        ):
+            manifest[url] = entry
+            unchanged += 1
+            continue
+        try:
+            manifest[url] = _build_variants(source, digest, output_dir)
+            processed += 1
+        except Exception as e:
+            print(f"Error processing image {source}: {e}")
+
+    # Variants no manifest entry refers to any more
+    referenced = {
+        candidate.split(" ")[0].rsplit("/", 1)[-1]
+        for entry in manifest.values()
+        for srcset in entry["sources"].values()
+        for candidate in srcset.split(", ")
+    }
+    for variant in output_dir.iterdir():
+        if variant.name != MANIFEST_NAME and variant.name not in referenced:
+            variant.unlink()
+
+    tmp_path = manifest_path.with_name(MANIFEST_NAME + ".tmp")
+    tmp_path.write_text(json.dumps(manifest, indent=1), encoding="utf-8")
+    os.replace(tmp_path, manifest_path)
+    return processed, unchanged
+
+
+@lru_cache(maxsize=4)
+def _load_manifest(path: Path, mtime_ns: int) -> Dict[str, Dict]:
+    """Read the variants manifest (cached until the file changes)."""
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        print(f"Error reading image manifest {path}: {e}")
+        return {}
+
+
+@lru_cache(maxsize=4)
+def _manifest_hash(path: Path, mtime_ns: int) -> str:
+    """Hash the variants manifest (cached until the file changes)."""
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()[:16]
+    except OSError:
+        return ""
+
+
+def get_image_manifest_hash() -> str:
+    """Get a hash of the variants manifest, for keying HTML rendered from it.
+
+    Returns:
+        Short hex digest, or "" if the manifest has not been built
+    """
+    path = get_assets_directory() / VARIANTS_DIRECTORY / MANIFEST_NAME
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return ""
+    return _manifest_hash(path, mtime_ns)
+
+
+def get_responsive_image(src: str) -> Optional[Dict]:
+    """Get the variants of an image.
+
+    Args:
+        src: Image URL relative to the site root, e.g. "/profile.jpg"
+
+    Returns:
+        Manifest entry ("width", "height", "placeholder", "sources" by MIME
+        type), or None if no variants were built for the image
+    """
+    path = get_assets_directory() / VARIANTS_DIRECTORY / MANIFEST_NAME
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return None
+    return _load_manifest(path, mtime_ns).get(src)
+
+
+def picture_html(src: str, alt: str = "", sizes: str = "100vw") -> str:
+    """Render an image as a responsive <picture> element.
+
+    Args:
+        src: Image URL
+        alt: Alternative text
+        sizes: The ``sizes`` attribute for choosing a variant
+
+    Returns:
+        HTML; a plain lazy-loaded <img> if the image has no variants
+    """
+    entry = get_responsive_image(src)
+    img_attrs = f'src="{html.escape(src)}" alt="{html.escape(alt)}" loading="lazy" decoding="async"'
+    if entry is None:
+        return f"<img {img_attrs}>"
+
+    sources = "".join(
+        f'<source type="{mime}" srcset="{html.escape(srcset)}" sizes="{html.escape(sizes)}">'
+        for mime, srcset in entry["sources"].items()
+    )
+    return (
+        f"<picture>{sources}<img {img_attrs} "
+        f'width="{entry["width"]}" height="{entry["height"]}" '
+        # The blur placeholder shows until the image has loaded
+        f'style="background-image:url({entry["placeholder"]});background-size:cover">'
+        "</picture>"
+    )
+
+
+def main() -> None:
+    """Build the image variants from the command line."""
+    processed, unchanged = build_image_variants()
+    print(f"Built variants of {processed} images ({unchanged} unchanged)")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,8 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+from retest.utils.blog_sitemap import BlogSitemapPlugin  # noqa: E402 (reads the .env settings)
+
 config = rx.Config(
     app_name="retest",
     frontend_port=os.getenv("REFLEX_FRONTEND_PORT"),
@@ -11,5 +13,5 @@ config = rx.Config(
     loglevel=os.getenv("REFLEX_LOGLEVEL"),
     deploy_url=os.getenv("REFLEX_DEPLOY_URL"),
     show_built_with_reflex=False,
-    plugins=[rx.plugins.TailwindV4Plugin(), rx.plugins.sitemap.SitemapPlugin()],
+    plugins=[rx.plugins.TailwindV4Plugin(), BlogSitemapPlugin()],
 )
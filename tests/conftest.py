@@ -0,0 +1,36 @@
+"""Fixtures shared by the blog tests: a temporary content root and a fresh index."""
+
+import pytest
+
+import retest.utils.blog as blog
+import retest.utils.blog_pack as blog_pack
+
+
+@pytest.fixture
+def blog_root(tmp_path, monkeypatch):
+    """Point the blog at an empty content root and drop the shared index."""
+    root = tmp_path / "blog_posts"
+    root.mkdir()
+    monkeypatch.setenv("BLOG_CONTENT_ROOTS", str(root))
+    monkeypatch.setenv("BLOG_INDEX_PATH", str(tmp_path / "blog_index.bin"))
+    monkeypatch.setattr(blog, "_blog_index", None)
+    monkeypatch.setattr(blog, "_blog_roots_checked_at", {})
+    monkeypatch.setattr(blog, "_blog_roots_watched", set())
+    monkeypatch.setattr(blog_pack, "_blog_pack", None)
+    monkeypatch.setattr(blog_pack, "_blog_pack_failure", None)
+    blog._blog_body_cache.clear()
+    return root
+
+
+@pytest.fixture
+def write_post(blog_root):
+    """Write a markdown post into the content root and return its path."""
+
+    def write(post_id, title=None, date="2024-01-01", body="Hello world.", **frontmatter):
+        lines = [f"title: {title or post_id}", f'date: "{date}"']
+        lines += [f"{key}: {value}" for key, value in frontmatter.items()]
+        path = blog_root / f"{post_id}.md"
+        path.write_text("---\n" + "\n".join(lines) + "\n---\n\n" + body + "\n", encoding="utf-8")
+        return path
+
+    return write
@@ -0,0 +1,29 @@
+import pytest
+
+from retest.utils.blog_backend import MarkdownBlogBackend
+from retest.utils.blog_sqlite import SqliteBlogBackend, import_blog_posts
+
+
+@pytest.fixture(params=["markdown", "sqlite"])
+def backend(request, blog_root, write_post, tmp_path):
+    write_post("live", date="2024-01-02", tags="[python]")
+    write_post("older", date="2024-01-01", tags="[python]")
+    write_post("draft", date="2024-01-03", tags="[python]", published="false")
+    write_post("later", date="2024-01-04", tags="[python]", publish_at='"2099-01-01T00:00:00+00:00"')
+    if request.param == "markdown":
+        return MarkdownBlogBackend()
+    db_path = tmp_path / "blog.sqlite3"
+    import_blog_posts(db_path, [blog_root])
+    return SqliteBlogBackend(db_path)
+
+
+def test_backends_filter_drafts_and_scheduled_posts_alike(backend):
+    listed = ["live", "older"]
+    assert [post["id"] for post in backend.recent_posts(10)] == listed
+    assert [post["id"] for post in backend.post_records()] == listed
+    assert [post["id"] for post in backend.posts_by_tag("python")] == listed
+    assert backend.tag_counts() == {"python": 2}
+    assert backend.get_post("draft")["title"] == "draft"
+    assert backend.get_post("later") is None
+    assert backend.adjacent_posts("draft") == (None, None)
+    assert [post["id"] for post in backend.related_posts("live")] == ["older"]
@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+from starlette.testclient import TestClient
+
+import retest.utils.blog as blog
+import retest.utils.blog_feeds as blog_feeds
+
+
+def test_if_modified_since_sees_second_post_on_same_day(write_post, monkeypatch):
+    monkeypatch.setattr(blog_feeds, "_feeds_version", None)
+    monkeypatch.setattr(blog_feeds, "_feeds", {})
+    client = TestClient(blog_feeds.blog_feed_api)
+
+    write_post("first", date="2024-03-01")
+    first = client.get("/blog/feed.xml")
+    assert first.status_code == 200
+    assert client.get(
+        "/blog/feed.xml", headers={"If-Modified-Since": first.headers["Last-Modified"]}
+    ).status_code == 304
+
+    # Same date, so the newest post date does not move
+    write_post("second", date="2024-03-01")
+    blog.get_blog_index(force_check=True)
+    second = client.get(
+        "/blog/feed.xml", headers={"If-Modified-Since": first.headers["Last-Modified"]}
+    )
+    assert second.status_code == 200
+    assert "second" in second.text
+    assert second.headers["ETag"] != first.headers["ETag"]
+    assert second.headers["Last-Modified"] != first.headers["Last-Modified"]
+    assert client.get(
+        "/blog/feed.xml", headers={"If-Modified-Since": second.headers["Last-Modified"]}
+    ).status_code == 304
+
+
+def test_unchanged_feed_keeps_last_modified(write_post, monkeypatch):
+    monkeypatch.setattr(blog_feeds, "_feeds_version", None)
+    monkeypatch.setattr(blog_feeds, "_feeds", {})
+
+    write_post("first", date="2024-03-01")
+    index = blog.get_blog_index(force_check=True)
+    feeds = blog_feeds.build_blog_feeds(index.posts)
+    assert blog_feeds.build_blog_feeds(index.posts, feeds) == feeds
+
+
+def test_feed_is_built_off_the_event_loop(write_post, monkeypatch):
+    build_feed = blog_feeds.get_blog_feed
+
+    def get_blog_feed(name):
+        # Only a worker thread has no running event loop
+        with pytest.raises(RuntimeError):
+            asyncio.get_running_loop()
+        return build_feed(name)
+
+    monkeypatch.setattr(blog_feeds, "_feeds_version", None)
+    monkeypatch.setattr(blog_feeds, "_feeds", {})
+    monkeypatch.setattr(blog_feeds, "get_blog_feed", get_blog_feed)
+    write_post("first", date="2024-03-01")
+    assert TestClient(blog_feeds.blog_feed_api).get("/blog/feed.json").status_code == 200
@@ -0,0 +1,36 @@
+import retest.utils.blog as blog
+import retest.utils.blog_pack as blog_pack
+
+
+def test_pack_records_match_parsed_records(blog_root, write_post, tmp_path, monkeypatch):
+    monkeypatch.setenv("HIGHLIGHT_CACHE_DIR", str(tmp_path / "highlight"))
+    write_post("quoted", date="2024-01-03", tags="[python]")
+    (blog_root / "unquoted.md").write_text(
+        "---\ntitle: Unquoted\ndate: 2024-01-02\nlast_modified: 2024-02-01 08:30:00\n---\n\nBody.\n",
+        encoding="utf-8",
+    )
+    (blog_root / "timed.md").write_text(
+        "---\ntitle: Timed\ndate: 2024-01-04 09:15:00\npublish_at: 2024-01-04T09:15:00+00:00\n"
+        "tags: rust\n---\n\n## Heading\n\nBody.\n",
+        encoding="utf-8",
+    )
+
+    parsed = {path.stem: blog.parse_blog_post_header(path) for path in blog_root.glob("*.md")}
+    blog_pack.build_blog_pack()
+    packed = {post["id"]: post for post in blog_pack.load_blog_pack().posts}
+
+    assert packed.keys() == parsed.keys()
+    for post_id, post in parsed.items():
+        assert packed[post_id].keys() == post.keys()
+        for key, value in post.items():
+            assert packed[post_id][key] == value, (post_id, key)
+            assert type(packed[post_id][key]) is type(value), (post_id, key)
+
+    # The index sorts and serves the same posts either way
+    from_pack = blog.get_blog_index(force_check=True)
+    monkeypatch.setattr(blog, "_blog_index", None)
+    monkeypatch.setattr(blog_pack, "_blog_pack", None)
+    monkeypatch.setenv("BLOG_INDEX_PATH", str(tmp_path / "missing.bin"))
+    from_markdown = blog.get_blog_index(force_check=True)
+    assert [post.to_dict() for post in from_pack.posts] == [post.to_dict() for post in from_markdown.posts]
+    assert [post["id"] for post in from_markdown.posts] == ["timed", "quoted", "unquoted"]
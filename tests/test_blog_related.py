@@ -0,0 +1,34 @@
+import threading
+
+import retest.utils.blog as blog
+from retest.utils.blog_related import _blog_related_index, get_related_posts
+
+
+def _call_with_timeout(function, *args, timeout=10):
+    """Run a call in a thread and fail instead of hanging on a deadlock."""
+    result = []
+    thread = threading.Thread(target=lambda: result.append(function(*args)), daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), f"{function.__name__} did not return"
+    return result[0]
+
+
+def test_related_posts_after_edit(write_post):
+    write_post("alpha", tags="[python, web]", body="Python web servers and async handlers.")
+    write_post("beta", tags="[python, web]", body="Async python handlers for web servers.")
+    write_post("gamma", tags="[rust]", body="Borrow checker lifetimes.")
+
+    assert [post["id"] for post in get_related_posts("alpha")] == ["beta"]
+
+    write_post("gamma", tags="[python]", body="Python async handlers.", date="2024-01-02")
+    # The next lookup notices the edit and runs the index listeners
+    blog._blog_roots_checked_at.clear()
+    _call_with_timeout(_blog_related_index.sync)
+
+    first = _call_with_timeout(get_related_posts, "alpha")
+    second = _call_with_timeout(get_related_posts, "alpha")
+    assert first == second
+    assert {post["id"] for post in first} == {"beta", "gamma"}
+    assert blog._blog_index_lock.acquire(timeout=1)
+    blog._blog_index_lock.release()
@@ -0,0 +1,21 @@
+import time
+from datetime import datetime, timezone
+
+import retest.utils.blog as blog
+
+PUBLISH_AT = "2099-01-01T00:00:00+00:00"
+PUBLISH_TIMESTAMP = datetime(2099, 1, 1, tzinfo=timezone.utc).timestamp()
+
+
+def test_scheduled_post_hidden_by_id_until_due(write_post, monkeypatch):
+    write_post("soon", publish_at=f'"{PUBLISH_AT}"', body="Not yet.")
+    write_post("draft", published="false", publish_at=f'"{PUBLISH_AT}"', body="Not yet either.")
+
+    assert "soon" in blog.get_blog_index(force_check=True).scheduled_by_id
+    assert blog.get_blog_post_by_id("soon") is None
+    assert blog.get_blog_post_by_id("draft") is None
+
+    monkeypatch.setattr(time, "time", lambda: PUBLISH_TIMESTAMP + 1)
+    post = blog.get_blog_post_by_id("soon")
+    assert post is not None and post["content"].strip() == "Not yet."
+    assert blog.get_blog_post_by_id("draft")["content"].strip() == "Not yet either."
@@ -0,0 +1,41 @@
+import threading
+
+import retest.utils.blog as blog
+from retest.utils.blog_search import search_blog_posts
+
+
+def test_search_while_posts_change(blog_root, write_post):
+    words = " ".join(f"word{i}" for i in range(200))
+    for i in range(40):
+        write_post(f"post-{i}", body=f"python {words}")
+    assert len(search_blog_posts("python", limit=100)) == 40
+
+    errors = []
+    stop = threading.Event()
+
+    def search():
+        while not stop.is_set():
+            try:
+                for result in search_blog_posts("python word7", limit=100):
+                    assert result["id"].startswith("post-")
+            except Exception as e:
+                errors.append(e)
+                stop.set()
+
+    searchers = [threading.Thread(target=search) for _ in range(4)]
+    for thread in searchers:
+        thread.start()
+    try:
+        for round_number in range(30):
+            for i in range(0, 40, 3):
+                path = blog_root / f"post-{i}.md"
+                if round_number % 2:
+                    write_post(f"post-{i}", body=f"python {words} edit{round_number}")
+                else:
+                    path.unlink()
+                blog.update_blog_index([path])
+    finally:
+        stop.set()
+        for thread in searchers:
+            thread.join()
+    assert not errors, errors[0]
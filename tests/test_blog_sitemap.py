@@ -0,0 +1,36 @@
+from starlette.testclient import TestClient
+
+import retest.utils.blog as blog
+import retest.utils.blog_sitemap as blog_sitemap
+
+
+def test_served_sitemap_follows_new_posts(write_post, monkeypatch):
+    monkeypatch.setattr(blog_sitemap, "_served_version", None)
+    monkeypatch.setattr(blog_sitemap, "_served_files", {})
+    client = TestClient(blog_sitemap.blog_sitemap_api)
+
+    write_post("first")
+    first = client.get("/sitemap.xml")
+    assert first.status_code == 200
+    assert first.headers["content-type"].startswith("application/xml")
+    assert "/blog/first</loc>" in first.text
+
+    write_post("second")
+    blog.get_blog_index(force_check=True)
+    assert "/blog/second</loc>" in client.get("/sitemap.xml").text
+    assert client.get("/sitemap-1.xml").status_code == 404
+
+
+def test_shards_need_a_deploy_url(monkeypatch):
+    monkeypatch.setattr(blog_sitemap, "SITEMAP_MAX_URLS", 1)
+    links = [{"loc": "https://example.com/a"}, {"loc": "https://example.com/b"}]
+
+    # Relative shard locations are not allowed in a sitemap index
+    assert [path for path, _ in blog_sitemap.render_sitemap_files(links, None)] == [
+        blog_sitemap.SITEMAP_PATH
+    ]
+
+    files = blog_sitemap.render_sitemap_files(links, "https://example.com/")
+    assert len(files) == 3
+    assert "<loc>https://example.com/sitemap-1.xml</loc>" in files[0][1]
+    assert "<loc>https://example.com/sitemap-2.xml</loc>" in files[0][1]